@@ -22,26 +22,74 @@ Features:
 
 __version__ = "0.1.0"
 
-# Core types
-from bbs_ansi_art.core.cell import Cell
-from bbs_ansi_art.core.canvas import Canvas
-from bbs_ansi_art.core.color import Color
-from bbs_ansi_art.core.document import AnsiDocument
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-# SAUCE metadata
-from bbs_ansi_art.sauce.record import SauceRecord
+if TYPE_CHECKING:
+    from bbs_ansi_art.core.cell import Cell
+    from bbs_ansi_art.core.canvas import Canvas
+    from bbs_ansi_art.core.color import Color
+    from bbs_ansi_art.core.document import AnsiDocument
+    from bbs_ansi_art.sauce.record import SauceRecord
+    from bbs_ansi_art.io.reader import load
+    from bbs_ansi_art.io.writer import save
+    from bbs_ansi_art.create.builder import ArtBuilder
 
-# Convenience functions
-from bbs_ansi_art.io.reader import load
-from bbs_ansi_art.io.writer import save
+# Public names resolved on first access (PEP 562), so `import bbs_ansi_art`
+# only pays for the submodules a caller actually touches.
+_LAZY_ATTRS = {
+    # Core types
+    "Cell": "bbs_ansi_art.core.cell",
+    "Canvas": "bbs_ansi_art.core.canvas",
+    "Color": "bbs_ansi_art.core.color",
+    "AnsiDocument": "bbs_ansi_art.core.document",
+    # SAUCE metadata
+    "SauceRecord": "bbs_ansi_art.sauce.record",
+    # Convenience functions
+    "load": "bbs_ansi_art.io.reader",
+    "save": "bbs_ansi_art.io.writer",
+    # Creation
+    "ArtBuilder": "bbs_ansi_art.create.builder",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Creation
-from bbs_ansi_art.create.builder import ArtBuilder
 
-def create(width: int = 80) -> ArtBuilder:
+def create(width: int = 80) -> "ArtBuilder":
     """Start creating new ANSI art with a fluent builder API."""
+    from bbs_ansi_art.create.builder import ArtBuilder
     return ArtBuilder(width)
 
+
+class _LazyPackage(ModuleType):
+    """Keep `create()` bound when the `create` subpackage is first imported.
+
+    The import system assigns each newly loaded submodule onto its parent
+    package, which would otherwise shadow the `create` function as soon as
+    the builder is lazily imported.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "create" and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
+
 __all__ = [
     # Version
     "__version__",
@@ -1,8 +0,0 @@
-"""CLI entry point - redirects to cli/ package."""
-
-from bbs_ansi_art.cli.main import main
-
-__all__ = ["main"]
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,5 @@
+"""Allow running the CLI with ``python -m bbs_ansi_art.cli``."""
+
+from bbs_ansi_art.cli.main import main
+
+main()
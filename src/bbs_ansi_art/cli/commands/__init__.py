@@ -1 +1,46 @@
-"""CLI commands."""
+"""CLI commands.
+
+Each module defines one Typer command plus a ``register(app)`` hook, so the
+app only imports and builds the commands it is about to run.
+"""
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from rich.console import Console
+
+# Command name -> module in this package
+COMMAND_MODULES = {
+    "view": "view",
+    "info": "info",
+    "convert": "convert",
+    "studio": "studio",
+    "edit": "edit",
+    "import-image": "import_image",
+    "clean": "clean",
+}
+
+# Batch commands only start a worker pool from this many files up; for
+# shorter runs the pool's start-up costs more than it saves.
+PARALLEL_MIN_FILES = 5
+
+
+@cache
+def get_console() -> "Console":
+    """Shared rich console, built on first use so plain commands skip rich."""
+    from rich.console import Console
+    return Console()
+
+
+@cache
+def get_ansi() -> "ModuleType":
+    """The ``bbs_ansi_art`` package, imported once and reused across calls.
+
+    Commands invoked repeatedly in one process (tests, tool loops) get the
+    module back from here instead of going through the import machinery.
+    """
+    import bbs_ansi_art
+    return bbs_ansi_art
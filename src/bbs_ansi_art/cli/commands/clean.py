@@ -0,0 +1,108 @@
+"""`clean` command - strip problematic escape sequences from ANSI files."""
+
+import os
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from bbs_ansi_art.cli.commands import PARALLEL_MIN_FILES, get_console
+
+
+def clean(
+    paths: Annotated[list[Path], typer.Argument(help="File(s) or directory to clean")],
+    output: Annotated[Optional[Path], typer.Option("--output", "-o", help="Output directory for cleaned files")] = None,
+    in_place: Annotated[bool, typer.Option("--in-place", "-i", help="Overwrite original files")] = False,
+    strip_sauce: Annotated[bool, typer.Option("--strip-sauce", "-s", help="Remove SAUCE metadata")] = False,
+    strip_text: Annotated[bool, typer.Option("--strip-text", "-t", help="Replace text with spaces (keep only graphical chars)")] = False,
+    sort: Annotated[bool, typer.Option("--sort/--no-sort", help="Process files in name order")] = True,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=0, help="Parallel workers (0 = one per CPU)")] = 0,
+) -> None:
+    """Clean problematic escape sequences from ANSI files.
+    
+    Removes sequences that cause display issues:
+    - Window manipulation (causes flicker/resize)
+    - Mode set/reset (not needed for display)
+    """
+    from bbs_ansi_art.repair import clean_file
+    console = get_console()
+    
+    # Collect all files to process
+    files: list[Path] = []
+    for p in paths:
+        # One directory pass, matching the extension in any case; scandir
+        # itself tells us when the path is a plain file, saving a stat.
+        try:
+            with os.scandir(p) as entries:
+                files.extend(
+                    Path(e.path) for e in entries
+                    if e.name.lower().endswith(".ans") and e.is_file()
+                )
+        except (NotADirectoryError, FileNotFoundError):
+            files.append(p)
+    
+    if not files:
+        console.print("[yellow]No .ans files found[/]")
+        return
+    
+    # Determine output directory
+    output_dir = output
+    if output_dir and not in_place:
+        output_dir.mkdir(exist_ok=True)
+    
+    if sort:
+        files.sort()
+    out_paths: list[Path] = []
+    for f in files:
+        if in_place:
+            out_paths.append(f)
+        elif output_dir:
+            out_paths.append(output_dir / f.name)
+        else:
+            out_paths.append(f.with_stem(f.stem + "_clean"))
+    
+    job = partial(clean_file, strip_sauce_data=strip_sauce, strip_text_data=strip_text)
+    
+    # Per-file log lines are printed in batches; one rich render per
+    # line dominates the loop on large directories.
+    log: list[str] = []
+    cleaned_count = 0
+    with ExitStack() as stack:
+        if jobs != 1 and len(files) >= PARALLEL_MIN_FILES:
+            # Files are independent, so spread them over worker processes;
+            # map() still yields results in file order for the log.
+            from concurrent.futures import ProcessPoolExecutor
+            
+            workers = min(jobs or os.cpu_count() or 1, len(files))
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            chunksize = max(1, len(files) // (workers * 4))
+            results = executor.map(job, files, out_paths, chunksize=chunksize)
+        else:
+            results = map(job, files, out_paths)
+        
+        for f, (_, result) in zip(files, results):
+            if result.was_modified:
+                msg = f"removed {result.sequences_removed} sequences"
+                if result.details.get('sauce_stripped'):
+                    msg += f", stripped SAUCE ({result.details['sauce_stripped']} bytes)"
+                if result.details.get('text_chars_stripped'):
+                    msg += f", stripped {result.details['text_chars_stripped']} text chars"
+                log.append(f"[green]{f.name}[/]: {msg}")
+                cleaned_count += 1
+            else:
+                log.append(f"[dim]{f.name}[/]: clean")
+            if len(log) >= 64:
+                console.print("\n".join(log))
+                log.clear()
+    
+    # Remaining log lines and the summary go out in one render
+    log.append(f"\n[bold]Cleaned {cleaned_count}/{len(files)} files[/]")
+    if output_dir and not in_place:
+        log.append(f"Output: {output_dir}")
+    console.print("\n".join(log))
+
+
+def register(app: typer.Typer) -> None:
+    app.command()(clean)
@@ -0,0 +1,49 @@
+"""`convert` command - export ANSI art to other formats."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Optional
+
+import typer
+
+from bbs_ansi_art.cli.commands import get_ansi
+
+if TYPE_CHECKING:
+    from bbs_ansi_art.core.document import AnsiDocument
+
+
+# Output writers, keyed by format name / file extension
+_CONVERTERS: dict[str, Callable[["AnsiDocument", Path], object]] = {
+    "html": lambda doc, dest: dest.write_text(doc.render_to_html()),
+    "txt": lambda doc, dest: dest.write_text(doc.render_to_text()),
+    "text": lambda doc, dest: dest.write_text(doc.render_to_text()),
+}
+_IMAGE_FORMATS = frozenset({"png", "jpg", "jpeg", "gif"})
+
+
+def convert(
+    source: Annotated[Path, typer.Argument(help="Source ANSI file")],
+    dest: Annotated[Path, typer.Argument(help="Destination file")],
+    format: Annotated[Optional[str], typer.Option("--format", "-f", help=f"Output format: {', '.join(_CONVERTERS)} (auto-detected from extension)")] = None,
+) -> None:
+    """Convert ANSI art to HTML, PNG, or plain text."""
+    ansi = get_ansi()
+    
+    doc = ansi.load(source)
+    fmt = format or dest.suffix.lstrip('.').lower()
+    
+    converter = _CONVERTERS.get(fmt)
+    if converter is not None:
+        converter(doc, dest)
+    elif fmt in _IMAGE_FORMATS:
+        typer.secho("Image export requires Pillow. Install with: uv pip install bbs-ansi-art[image]", fg="red")
+        raise typer.Exit(1)
+    else:
+        typer.secho(f"Unknown format: {fmt}", fg="red")
+        raise typer.Exit(1)
+    
+    typer.secho(f"Converted {source} → {dest}", fg="green")
+
+
+def register(app: typer.Typer) -> None:
+    app.command()(convert)
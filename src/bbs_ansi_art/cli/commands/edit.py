@@ -0,0 +1,19 @@
+"""`edit` command - edit an ANSI art file interactively."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def edit(
+    path: Annotated[Path, typer.Argument(help="File to edit")],
+):
+    """Edit ANSI art file interactively."""
+    from bbs_ansi_art.cli.studio.editor import EditorApp
+    editor = EditorApp(path)
+    editor.run()
+
+
+def register(app: typer.Typer) -> None:
+    app.command()(edit)
@@ -0,0 +1,160 @@
+"""`import-image` command - convert images to terminal art."""
+
+import os
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from bbs_ansi_art.cli.commands import PARALLEL_MIN_FILES, get_console
+
+
+def _convert(
+    convert: Callable[[Path, Path], object], source: Path, out_path: Path
+) -> BaseException | None:
+    """Run one conversion, returning its error instead of raising it."""
+    try:
+        convert(source, out_path)
+    except Exception as e:
+        return e
+    return None
+
+
+def import_image(
+    sources: Annotated[list[str], typer.Argument(help="Source image(s) or glob pattern (e.g., 'logo-*.png')")],
+    output: Annotated[Optional[Path], typer.Option("--output", "-o", help="Output file or directory")] = None,
+    width: Annotated[int, typer.Option("--width", "-w", help="Target width in characters")] = 78,
+    no_sharpen: Annotated[bool, typer.Option("--no-sharpen", help="Disable sharpening")] = False,
+    color_boost: Annotated[float, typer.Option("--color-boost", help="Color saturation multiplier")] = 1.5,
+    contrast_boost: Annotated[float, typer.Option("--contrast-boost", help="Contrast multiplier")] = 1.2,
+    black_threshold: Annotated[int, typer.Option("--black-threshold", help="RGB values below this become pure black")] = 30,
+    transparent: Annotated[bool, typer.Option("--transparent", "-t", help="Preserve PNG alpha as transparent background")] = False,
+    alpha_threshold: Annotated[int, typer.Option("--alpha-threshold", help="Alpha values below this are transparent")] = 128,
+    transparent_color: Annotated[Optional[str], typer.Option("--transparent-color", "-k", help="Chroma key: treat this color as transparent (e.g., black, #FF00FF)")] = None,
+    color_tolerance: Annotated[int, typer.Option("--color-tolerance", help="How close to transparent-color to be transparent")] = 30,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=0, help="Parallel workers for batch conversion (0 = one per CPU)")] = 0,
+    sort: Annotated[bool, typer.Option("--sort/--no-sort", help="Process files in name order")] = True,
+) -> None:
+    """Convert image(s) to terminal art (.art format).
+    
+    Creates .art files using true color (24-bit RGB) and half-block
+    characters for high-fidelity display in modern terminals.
+    
+    Supports glob patterns for batch conversion.
+    
+    Examples:
+        bbs-ansi-art import-image logo.png
+        bbs-ansi-art import-image logo.png -o logo.art -w 60
+        bbs-ansi-art import-image 'amplifier-art-*.png' -o art/
+        bbs-ansi-art import-image logo.png -k black  # black becomes transparent
+        cat logo.art  # display it
+    """
+    import glob
+    console = get_console()
+    
+    try:
+        from bbs_ansi_art.import_image import from_png
+    except ImportError:
+        console.print("[red]Pillow is required for image import.[/]")
+        console.print("Install with: [cyan]uv pip install bbs-ansi-art[image][/]")
+        raise typer.Exit(1)
+    
+    # Expand glob patterns; plain paths skip the directory scan entirely
+    files: list[Path] = []
+    for pattern in sources:
+        if any(c in pattern for c in "*?["):
+            matched = len(files)
+            files.extend(Path(m) for m in glob.iglob(pattern))
+            if len(files) > matched:
+                continue
+        # Treat as literal path
+        files.append(Path(pattern))
+    
+    if not files:
+        console.print("[red]No files matched[/]")
+        raise typer.Exit(1)
+    
+    # Determine output mode
+    is_batch = len(files) > 1
+    out_dir: Optional[Path] = None
+    
+    if is_batch:
+        if output:
+            out_dir = output
+            out_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            console.print("[red]Multiple files require --output directory[/]")
+            raise typer.Exit(1)
+    
+    # Process files
+    convert = partial(
+        from_png,
+        width=width,
+        sharpen=not no_sharpen,
+        color_boost=color_boost,
+        contrast_boost=contrast_boost,
+        transparent=transparent,
+        alpha_threshold=alpha_threshold,
+        black_threshold=black_threshold,
+        transparent_color=transparent_color,
+        color_tolerance=color_tolerance,
+    )
+    if sort:
+        files.sort()
+    tasks: list[tuple[Path, Path]] = []
+    for source in files:
+        if is_batch:
+            out_path = out_dir / source.with_suffix(".art").name
+        else:
+            out_path = output or source.with_suffix(".art")
+        tasks.append((source, out_path))
+    
+    # Per-file lines are collected and printed in batches rather than one
+    # rich render per file.
+    log: list[str] = []
+    
+    def report(source: Path, out_path: Path, error: Optional[BaseException]) -> bool:
+        if error is None:
+            log.append(f"[green]{source.name}[/] → {out_path.name}")
+        elif isinstance(error, FileNotFoundError) and (
+            error.filename is None or Path(error.filename) == source
+        ):
+            log.append(f"[yellow]Skipping (not found): {source}[/]")
+        else:
+            log.append(f"[red]{source.name}: {error}[/]")
+        if len(log) >= 64:
+            console.print("\n".join(log))
+            log.clear()
+        return error is None
+    
+    job = partial(_convert, convert)
+    in_paths = [source for source, _ in tasks]
+    out_paths = [out_path for _, out_path in tasks]
+    success = 0
+    if jobs != 1 and len(tasks) >= PARALLEL_MIN_FILES:
+        # Conversion is CPU-bound and files are independent, so fan out
+        # across processes; map() still yields results in file order.
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = min(jobs or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            errors = executor.map(job, in_paths, out_paths)
+            for source, out_path, error in zip(in_paths, out_paths, errors):
+                success += report(source, out_path, error)
+    else:
+        errors = map(job, in_paths, out_paths)
+        for source, out_path, error in zip(in_paths, out_paths, errors):
+            success += report(source, out_path, error)
+    
+    if is_batch:
+        log.append(f"\n[bold]Converted {success}/{len(files)} files[/] ({width} cols)")
+        log.append(f"[dim]View with: cat {out_dir}/*.art[/]")
+    elif success:
+        log.append(f"[dim]View with: cat {out_path}[/]")
+    console.print("\n".join(log))
+
+
+def register(app: typer.Typer) -> None:
+    app.command("import-image")(import_image)
@@ -0,0 +1,65 @@
+"""`info` command - show SAUCE metadata for an ANSI file."""
+
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from bbs_ansi_art.cli.commands import get_ansi, get_console
+
+# Prefer orjson's C encoder when installed; stdlib json otherwise
+try:
+    import orjson
+
+    def _to_json(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _to_json(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+
+def info(
+    path: Annotated[Path, typer.Argument(help="ANSI file to inspect")],
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+) -> None:
+    """Show SAUCE metadata for an ANSI file."""
+    ansi = get_ansi()
+    console = get_console()
+    
+    doc = ansi.load(path)
+    
+    if not doc.sauce:
+        console.print(f"[yellow]No SAUCE metadata found in {path}[/]")
+        raise typer.Exit(1)
+    
+    if json_output:
+        data = {
+            "title": doc.sauce.title,
+            "author": doc.sauce.author,
+            "group": doc.sauce.group,
+            "date": doc.sauce.date.isoformat() if doc.sauce.date else None,
+            "width": doc.sauce.tinfo1,
+            "height": doc.sauce.tinfo2,
+            "comments": doc.sauce.comments,
+        }
+        typer.echo(_to_json(data))
+    else:
+        lines = [
+            f"[bold cyan]SAUCE Metadata for {path.name}[/]",
+            f"  [bold]Title:[/]  {doc.sauce.title or '(none)'}",
+            f"  [bold]Author:[/] {doc.sauce.author or '(none)'}",
+            f"  [bold]Group:[/]  {doc.sauce.group or '(none)'}",
+        ]
+        if doc.sauce.date:
+            lines.append(f"  [bold]Date:[/]   {doc.sauce.date.strftime('%Y-%m-%d')}")
+        lines.append(f"  [bold]Size:[/]   {doc.sauce.tinfo1}x{doc.sauce.tinfo2}")
+        if doc.sauce.comments:
+            lines.append("  [bold]Comments:[/]")
+            lines.extend(f"    {comment}" for comment in doc.sauce.comments)
+        console.print("\n".join(lines))
+
+
+def register(app: typer.Typer) -> None:
+    app.command()(info)
@@ -0,0 +1,18 @@
+"""`studio` command - launch the interactive studio."""
+
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+
+def studio(
+    path: Annotated[Optional[Path], typer.Argument(help="Optional file or directory")] = None,
+) -> None:
+    """Launch the interactive ANSI art studio."""
+    from bbs_ansi_art.cli.studio.viewer import run_viewer
+    run_viewer(path)
+
+
+def register(app: typer.Typer) -> None:
+    app.command()(studio)
@@ -0,0 +1,49 @@
+"""`view` command - print ANSI art or open it in the studio."""
+
+import sys
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from bbs_ansi_art.cli.commands import get_ansi, get_console
+
+
+def view(
+    path: Annotated[Path, typer.Argument(help="File or directory to view")],
+    interactive: Annotated[bool, typer.Option("--interactive", "-i", help="Launch interactive studio")] = False,
+    sauce: Annotated[bool, typer.Option("--sauce", "-s", help="Show SAUCE metadata")] = False,
+) -> None:
+    """View ANSI artwork in terminal or studio."""
+    ansi = get_ansi()
+    
+    if path.is_dir() or interactive:
+        # Launch studio viewer
+        from bbs_ansi_art.cli.studio.viewer import run_viewer
+        run_viewer(path if path.exists() else None)
+    else:
+        # Simple terminal output
+        doc = ansi.load(path)
+        
+        if sauce and doc.sauce:
+            get_console().print(
+                f"[bold]Title:[/] {doc.sauce.title}\n"
+                f"[bold]Author:[/] {doc.sauce.author}\n"
+                f"[bold]Group:[/] {doc.sauce.group}\n"
+                f"[bold]Size:[/] {doc.sauce.tinfo1}x{doc.sauce.tinfo2}\n"
+            )
+        
+        # Hand the encoded art straight to the binary stream, skipping the
+        # text layer's encoder; fall back to print() when stdout is not a
+        # real file (e.g. captured by a test runner).
+        stream = getattr(sys.stdout, "buffer", None)
+        if stream is None:
+            print(doc.render())
+        else:
+            sys.stdout.flush()
+            stream.write(doc.render().encode("utf-8", "replace") + b"\n")
+            stream.flush()
+
+
+def register(app: typer.Typer) -> None:
+    app.command()(view)
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-# Pattern to match ANSI escape sequences (including ~ terminator for F-keys, etc.)
-_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[A-Za-z~]')
+# Escape-sequence patterns shared by the CLI, compiled once. They only ever
+# match ASCII, so re.ASCII is set throughout.
 
+# Any CSI sequence, including the ~ terminator used by F-keys etc.
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[A-Za-z~]', re.ASCII)
+# CSI sequences ending in a letter
+CSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]', re.ASCII)
+# SGR (color/attribute) sequences only
+SGR_ESCAPE = re.compile(r'\x1b\[[0-9;]*m', re.ASCII)
 
+
+# Rows are often measured again on later frames (redraws, scrolling), and
+# strings cache their own hash, so a hit is far cheaper than a rescan.
+@lru_cache(maxsize=1024)
 def visible_len(s: str) -> int:
     """Get visible length of string (excluding ANSI escape codes)."""
-    return len(_ANSI_ESCAPE.sub('', s))
+    if '\x1b' not in s:
+        return len(s)
+    # Stripping in C beats both summing match lengths and a Python scanner
+    return len(ANSI_ESCAPE.sub('', s))
 
 
 def truncate(s: str, max_width: int, reset: bool = True) -> str:
@@ -27,39 +41,46 @@ def truncate(s: str, max_width: int, reset: bool = True) -> str:
     """
     if max_width <= 0:
         return ""
+    # Visible length never exceeds len(s), so short strings always fit
+    if len(s) <= max_width:
+        return s
+    if '\x1b' not in s:
+        output = s[:max_width]
+        return output + '\x1b[0m' if reset else output
     
-    result: list[str] = []
-    vis_len = 0
-    i = 0
-    was_truncated = False
-    
-    while i < len(s) and vis_len < max_width:
-        if s[i] == '\x1b' and i + 1 < len(s) and s[i + 1] == '[':
-            # ANSI escape sequence - include whole thing
-            j = i + 2
-            while j < len(s) and s[j] not in 'ABCDEFGHJKSTfmsu~':
-                j += 1
-            if j < len(s):
-                j += 1  # Include terminator
-            result.append(s[i:j])
-            i = j
-        else:
-            result.append(s[i])
-            vis_len += 1
-            i += 1
-    
-    # Check if we truncated
-    was_truncated = i < len(s)
-    
-    output = ''.join(result)
+    output, _, _ = _measure_and_truncate(s, max_width)
     
     # Append reset if truncated to prevent color bleed
-    if reset and was_truncated:
+    if reset and len(output) < len(s):
         output += '\x1b[0m'
     
     return output
 
 
+def _measure_and_truncate(s: str, max_width: int) -> tuple[str, int, bool]:
+    """Cut s to at most max_width visible chars in a single pass.
+    
+    Returns the prefix, its visible length, and whether visible characters
+    were dropped (as opposed to only trailing escape sequences).
+    """
+    # Walk escape matches and copy whole text runs between them, so the
+    # Python-level loop runs once per escape rather than once per char.
+    remaining = max_width
+    pos = 0
+    for m in ANSI_ESCAPE.finditer(s):
+        run = m.start() - pos
+        if run >= remaining:
+            end = pos + remaining
+            overflow = run > remaining or visible_len(s[m.end():]) > 0
+            break
+        remaining -= run
+        pos = m.end()
+    else:
+        end = min(pos + remaining, len(s))
+        overflow = pos + remaining < len(s)
+    return s[:end], max_width - remaining + (end - pos), overflow
+
+
 def pad_to_width(s: str, width: int, char: str = ' ') -> str:
     """Pad string with char to reach exactly width visible characters.
     
@@ -77,10 +98,38 @@ def truncate_and_pad(s: str, width: int) -> str:
     
     Adds a reset before padding to prevent color bleed.
     """
-    vlen = visible_len(s)
-    if vlen > width:
-        return truncate(s, width)
+    if width <= 0:
+        return truncate(s, width) if visible_len(s) > width else s
+    
+    head, vlen, overflow = _measure_and_truncate(s, width)
+    if overflow:
+        return head + '\x1b[0m'
     elif vlen < width:
         # Reset colors before padding to prevent color bleed
         return s + '\x1b[0m' + ' ' * (width - vlen)
     return s
+
+
+def fit_to_width(s: str, width: int) -> str:
+    """Same result as pad_to_width(truncate(s, width), width), in one pass.
+    
+    Unlike truncate_and_pad, a reset is appended whenever anything is cut,
+    including escapes trailing the last visible char, so nothing bleeds
+    into whatever follows.
+    """
+    if width <= 0:
+        return ""
+    if '\x1b' not in s:
+        n = len(s)
+        if n > width:
+            return s[:width] + '\x1b[0m'
+    elif len(s) > width:
+        head, n, _ = _measure_and_truncate(s, width)
+        if len(head) < len(s):
+            return head + '\x1b[0m'
+    else:
+        n = visible_len(s)
+    if n < width:
+        # Reset colors before padding to prevent color bleed
+        return s + '\x1b[0m' + ' ' * (width - n)
+    return s
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import os
 import sys
-import select
+import selectors
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import Any, Optional, cast
 
 
 class Key(Enum):
@@ -52,6 +52,97 @@ class KeyEvent:
         return self.char is not None and self.key is None
 
 
+# Lookup tables live at module level so the keystroke path reads them as
+# globals rather than through the class.
+
+# Escape sequence mappings (without the \x1b prefix)
+# Format: sequence -> (Key, shift, ctrl, alt)
+_SEQUENCES: dict[str, Key] = {
+    # Arrow keys (CSI)
+    '[A': Key.UP,
+    '[B': Key.DOWN,
+    '[C': Key.RIGHT,
+    '[D': Key.LEFT,
+    # Arrow keys (SS3 - application mode)
+    'OA': Key.UP,
+    'OB': Key.DOWN,
+    'OC': Key.RIGHT,
+    'OD': Key.LEFT,
+    # Navigation
+    '[H': Key.HOME,
+    '[F': Key.END,
+    '[1~': Key.HOME,
+    '[4~': Key.END,
+    '[5~': Key.PAGE_UP,
+    '[6~': Key.PAGE_DOWN,
+    '[2~': Key.INSERT,
+    '[3~': Key.DELETE,
+    # Function keys
+    'OP': Key.F1,
+    'OQ': Key.F2,
+    'OR': Key.F3,
+    'OS': Key.F4,
+    '[15~': Key.F5,
+    '[21~': Key.F10,
+    '[24~': Key.F12,
+}
+
+# Shift+Arrow sequences (various terminal formats)
+_SHIFT_SEQUENCES: dict[str, Key] = {
+    # xterm/most terminals: CSI 1;2 A/B/C/D
+    '[1;2A': Key.UP,
+    '[1;2B': Key.DOWN,
+    '[1;2C': Key.RIGHT,
+    '[1;2D': Key.LEFT,
+    # Some terminals use different format
+    '[2A': Key.UP,
+    '[2B': Key.DOWN,
+    '[2C': Key.RIGHT,
+    '[2D': Key.LEFT,
+}
+
+# Ctrl+Arrow sequences
+_CTRL_SEQUENCES: dict[str, Key] = {
+    '[1;5A': Key.UP,
+    '[1;5B': Key.DOWN,
+    '[1;5C': Key.RIGHT,
+    '[1;5D': Key.LEFT,
+}
+
+_SIMPLE_KEYS: dict[str, Key] = {
+    '\r': Key.ENTER,
+    '\n': Key.ENTER,
+    '\t': Key.TAB,
+    '\x7f': Key.BACKSPACE,
+    '\x08': Key.BACKSPACE,
+}
+
+# Prefix tree over all escape sequences above, built once at import.
+# Inner nodes map the next byte to a child; a complete sequence stores
+# its KeyEvent under the None key. Every sequence ends in its
+# terminator, so the first complete match is the longest one.
+# KeyEvent is frozen, so one shared instance per sequence is handed out
+# instead of constructing a new event on every keypress.
+_TRIE: dict[int | None, Any] = {}
+for _table, _shift, _ctrl in (
+    (_SEQUENCES, False, False),
+    (_SHIFT_SEQUENCES, True, False),
+    (_CTRL_SEQUENCES, False, True),
+):
+    for _seq, _key in _table.items():
+        _node = _TRIE
+        for _byte in _seq.encode('ascii'):
+            _node = _node.setdefault(_byte, {})
+        _node[None] = KeyEvent(key=_key, raw='\x1b' + _seq, shift=_shift, ctrl=_ctrl)
+del _table, _shift, _ctrl, _seq, _key, _node, _byte
+
+# Shared events for _SIMPLE_KEYS, keyed by byte value
+_SIMPLE_EVENTS: dict[int, KeyEvent] = {
+    ord(ch): KeyEvent(key=key, raw=ch) for ch, key in _SIMPLE_KEYS.items()
+}
+_ESCAPE_EVENT = KeyEvent(key=Key.ESCAPE, raw='\x1b')
+
+
 class InputReader:
     """
     Non-blocking keyboard input reader.
@@ -60,77 +151,63 @@ class InputReader:
     handle escape sequences that may arrive split across reads.
     """
 
-    # Escape sequence mappings (without the \x1b prefix)
-    # Format: sequence -> (Key, shift, ctrl, alt)
-    SEQUENCES: dict[str, Key] = {
-        # Arrow keys (CSI)
-        '[A': Key.UP,
-        '[B': Key.DOWN,
-        '[C': Key.RIGHT,
-        '[D': Key.LEFT,
-        # Arrow keys (SS3 - application mode)
-        'OA': Key.UP,
-        'OB': Key.DOWN,
-        'OC': Key.RIGHT,
-        'OD': Key.LEFT,
-        # Navigation
-        '[H': Key.HOME,
-        '[F': Key.END,
-        '[1~': Key.HOME,
-        '[4~': Key.END,
-        '[5~': Key.PAGE_UP,
-        '[6~': Key.PAGE_DOWN,
-        '[2~': Key.INSERT,
-        '[3~': Key.DELETE,
-        # Function keys
-        'OP': Key.F1,
-        'OQ': Key.F2,
-        'OR': Key.F3,
-        'OS': Key.F4,
-        '[15~': Key.F5,
-        '[21~': Key.F10,
-        '[24~': Key.F12,
-    }
-    
-    # Shift+Arrow sequences (various terminal formats)
-    SHIFT_SEQUENCES: dict[str, Key] = {
-        # xterm/most terminals: CSI 1;2 A/B/C/D
-        '[1;2A': Key.UP,
-        '[1;2B': Key.DOWN,
-        '[1;2C': Key.RIGHT,
-        '[1;2D': Key.LEFT,
-        # Some terminals use different format
-        '[2A': Key.UP,
-        '[2B': Key.DOWN,
-        '[2C': Key.RIGHT,
-        '[2D': Key.LEFT,
-    }
-    
-    # Ctrl+Arrow sequences
-    CTRL_SEQUENCES: dict[str, Key] = {
-        '[1;5A': Key.UP,
-        '[1;5B': Key.DOWN,
-        '[1;5C': Key.RIGHT,
-        '[1;5D': Key.LEFT,
-    }
-    
-    SIMPLE_KEYS: dict[str, Key] = {
-        '\r': Key.ENTER,
-        '\n': Key.ENTER,
-        '\t': Key.TAB,
-        '\x7f': Key.BACKSPACE,
-        '\x08': Key.BACKSPACE,
-    }
+    # Public aliases of the module-level tables
+    SEQUENCES = _SEQUENCES
+    SHIFT_SEQUENCES = _SHIFT_SEQUENCES
+    CTRL_SEQUENCES = _CTRL_SEQUENCES
+    SIMPLE_KEYS = _SIMPLE_KEYS
 
     def __init__(self) -> None:
-        self._buffer = ""
+        # Raw input bytes; only printable characters are ever decoded
+        self._buffer = bytearray()
         self._fd = sys.stdin.fileno()
+        # One selector registered for the life of the reader (epoll/kqueue
+        # where available), rather than building a select() set per poll
+        self._selector: Optional[selectors.BaseSelector] = selectors.DefaultSelector()
+        try:
+            self._selector.register(self._fd, selectors.EVENT_READ)
+        except (ValueError, OSError):
+            # epoll refuses some fds (e.g. regular files); select() takes any
+            self._selector.close()
+            self._selector = selectors.SelectSelector()
+            self._selector.register(self._fd, selectors.EVENT_READ)
+
+    def watch(self, fd: int) -> bool:
+        """Also wake from read() when fd turns readable.
+        
+        Whatever arrives on fd is drained and discarded; read() then
+        returns None unless a key is waiting too. Returns False if fd
+        could not be watched.
+        """
+        if self._selector is None:
+            return False
+        try:
+            self._selector.register(fd, selectors.EVENT_READ)
+        except (ValueError, KeyError, OSError):
+            return False
+        return True
+
+    def unwatch(self, fd: int) -> None:
+        """Stop waking on fd (see watch())."""
+        if self._selector is None:
+            return
+        try:
+            self._selector.unregister(fd)
+        except (ValueError, KeyError, OSError):
+            pass
+
+    def close(self) -> None:
+        """Release the input selector."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
 
-    def read(self, timeout: float = 0.1) -> Optional[KeyEvent]:
+    def read(self, timeout: Optional[float] = 0.1) -> Optional[KeyEvent]:
         """
         Read a single key event.
         
-        Returns None if no input available within timeout.
+        Returns None if no input available within timeout. A timeout of
+        None waits until input arrives.
         """
         # Process any buffered input first
         if self._buffer:
@@ -151,136 +228,140 @@ class InputReader:
         """Read all currently available input into buffer using os.read."""
         try:
             # Read up to 1024 bytes at once - gets everything available
-            data = os.read(self._fd, 1024)
-            self._buffer += data.decode('utf-8', errors='replace')
+            self._buffer += os.read(self._fd, 1024)
         except (OSError, BlockingIOError):
             pass
         
         # If buffer is just escape, wait for potential sequence
-        if self._buffer == '\x1b':
+        if self._buffer == b'\x1b':
             self._wait_for_escape_sequence()
 
     def _wait_for_escape_sequence(self) -> None:
-        """Wait for escape sequence to complete with proper timeouts."""
-        deadline = time.monotonic() + 0.1  # 100ms total wait
+        """Wait up to 100ms for the rest of an escape sequence to arrive.
         
-        while time.monotonic() < deadline:
-            remaining = deadline - time.monotonic()
-            wait_time = min(remaining, 0.025)  # 25ms intervals
+        Each select() waits for whatever is left of the deadline, so the
+        loop only wakes when input arrives instead of on fixed ticks.
+        """
+        deadline = time.monotonic() + 0.1
+        timeout = 0.1
+        while timeout > 0 and self._has_input(timeout):
+            try:
+                self._buffer += os.read(self._fd, 1024)
+            except (OSError, BlockingIOError):
+                pass
             
-            if wait_time <= 0:
-                break
-                
-            if self._has_input(wait_time):
-                try:
-                    data = os.read(self._fd, 1024)
-                    self._buffer += data.decode('utf-8', errors='replace')
-                except (OSError, BlockingIOError):
-                    pass
-                
-                # Check if sequence looks complete
-                if len(self._buffer) > 1:
-                    rest = self._buffer[1:]
-                    # Sequence ends with letter or ~
-                    if rest and (rest[-1].isalpha() or rest[-1] == '~'):
-                        return
-                    # Or we have a known sequence
-                    if rest in self.SEQUENCES:
-                        return
+            # Sequence looks complete once it ends with a letter or ~
+            # (a bare SS3 introducer, ESC O, still needs its final byte)
+            last = self._buffer[-1:]
+            if (last.isalpha() or last == b'~') and self._buffer != b'\x1bO':
+                return
+            timeout = deadline - time.monotonic()
 
     def _process_buffer(self) -> Optional[KeyEvent]:
         """Process buffered input and return next key event."""
         if not self._buffer:
             return None
         
+        first = self._buffer[0]
+        
         # Simple keys
-        if self._buffer[0] in self.SIMPLE_KEYS:
-            key = self.SIMPLE_KEYS[self._buffer[0]]
-            raw = self._buffer[0]
-            self._buffer = self._buffer[1:]
-            return KeyEvent(key=key, raw=raw)
+        event = _SIMPLE_EVENTS.get(first)
+        if event is not None:
+            del self._buffer[:1]
+            return event
         
         # Escape sequence
-        if self._buffer[0] == '\x1b':
+        if first == 0x1B:
             return self._parse_escape_sequence()
         
-        # Printable character
-        if self._buffer[0].isprintable():
-            ch = self._buffer[0]
-            self._buffer = self._buffer[1:]
+        # Printable character - decode just this one (possibly multi-byte) char
+        if first < 0x80:
+            size = 1
+        elif first >= 0xF0:
+            size = 4
+        elif first >= 0xE0:
+            size = 3
+        else:
+            size = 2
+        ch = self._buffer[:size].decode('utf-8', errors='replace')
+        if len(ch) != 1:
+            ch, size = '\ufffd', 1
+        del self._buffer[:size]
+        if ch.isprintable():
             return KeyEvent(char=ch, raw=ch)
         
         # Unknown control character - skip it
-        self._buffer = self._buffer[1:]
         return None
 
     def _parse_escape_sequence(self) -> KeyEvent:
         """Parse an escape sequence from the buffer."""
         # Buffer starts with \x1b
-        if len(self._buffer) == 1:
+        buf = self._buffer
+        if len(buf) == 1:
             # Just escape, no sequence
-            self._buffer = ""
-            return KeyEvent(key=Key.ESCAPE, raw='\x1b')
+            buf.clear()
+            return _ESCAPE_EVENT
         
-        # Look for matching sequence (without the \x1b prefix)
-        rest = self._buffer[1:]
+        # Walk the trie for a known sequence (without the \x1b prefix)
+        node = _TRIE
+        for i in range(1, len(buf)):
+            child = node.get(buf[i])
+            if child is None:
+                break
+            node = child
+            event = node.get(None)
+            if event is not None:
+                del buf[:i + 1]
+                return cast(KeyEvent, event)
         
-        # Find where this sequence ends
-        end_idx = 0
-        for i, ch in enumerate(rest):
-            if ch == '\x1b':
+        # Unknown sequence - consume up to its terminator
+        end = 1
+        while end < len(buf):
+            if buf[end] == 0x1B:
                 # Start of next escape sequence
-                end_idx = i
                 break
-            if ch.isalpha() or ch == '~':
+            end += 1
+            if buf[end - 1:end].isalpha() or buf[end - 1] == 0x7E:
                 # End of this sequence
-                end_idx = i + 1
                 break
-            end_idx = i + 1
-        
-        if end_idx == 0:
-            # Nothing after escape
-            self._buffer = ""
-            return KeyEvent(key=Key.ESCAPE, raw='\x1b')
-        
-        seq = rest[:end_idx]
-        
-        if seq in self.SEQUENCES:
-            key = self.SEQUENCES[seq]
-            raw = '\x1b' + seq
-            self._buffer = self._buffer[1 + end_idx:]
-            return KeyEvent(key=key, raw=raw)
-        
-        # Check for Shift+Arrow sequences
-        if seq in self.SHIFT_SEQUENCES:
-            key = self.SHIFT_SEQUENCES[seq]
-            raw = '\x1b' + seq
-            self._buffer = self._buffer[1 + end_idx:]
-            return KeyEvent(key=key, raw=raw, shift=True)
         
-        # Check for Ctrl+Arrow sequences
-        if seq in self.CTRL_SEQUENCES:
-            key = self.CTRL_SEQUENCES[seq]
-            raw = '\x1b' + seq
-            self._buffer = self._buffer[1 + end_idx:]
-            return KeyEvent(key=key, raw=raw, ctrl=True)
+        if end == 1:
+            # Another escape follows immediately - this one stands alone
+            del buf[:1]
+            return _ESCAPE_EVENT
         
-        # Unknown sequence
-        raw = '\x1b' + seq
-        self._buffer = self._buffer[1 + end_idx:]
+        raw = buf[:end].decode('utf-8', errors='replace')
+        del buf[:end]
         return KeyEvent(raw=raw)
 
     def read_blocking(self) -> KeyEvent:
         """Read a key event, blocking until input is available."""
         while True:
-            event = self.read(timeout=1.0)
+            event = self.read(timeout=None)
             if event is not None:
                 return event
 
-    def _has_input(self, timeout: float) -> bool:
-        """Check if input is available within timeout."""
+    def _has_input(self, timeout: Optional[float]) -> bool:
+        """Check if input is available within timeout (None waits indefinitely)."""
+        if self._selector is None:
+            return False
         try:
-            ready, _, _ = select.select([self._fd], [], [], timeout)
-            return bool(ready)
+            ready = self._selector.select(timeout)
         except (ValueError, OSError):
             return False
+        has_input = False
+        for key, _ in ready:
+            if key.fd == self._fd:
+                has_input = True
+            else:
+                self._drain(key.fd)
+        return has_input
+
+    @staticmethod
+    def _drain(fd: int) -> None:
+        """Discard everything readable on a watched (non-blocking) fd."""
+        try:
+            while os.read(fd, 512):
+                pass
+        except OSError:
+            pass
@@ -7,8 +7,10 @@ Breakpoints designed around 80-column ANSI art as the anchor:
 - WIDE (140+):      Comfortable browser + art with padding
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -26,9 +28,13 @@ class ActivePanel(Enum):
     ART = "art"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Layout:
-    """Computed layout dimensions for current terminal size."""
+    """Computed layout dimensions for current terminal size.
+    
+    Frozen, since calculate_layout hands the same cached instance to
+    every caller with the same inputs.
+    """
     mode: LayoutMode
     term_width: int
     term_height: int
@@ -62,110 +68,112 @@ SEPARATOR_WIDTH = 1
 STATUS_HEIGHT = 1
 
 
-def calculate_layout(
+# Every builder takes the same arguments so calculate_layout can dispatch
+# through _BUILDERS; the narrow and compact ones ignore browser_visible.
+
+
+def _narrow_layout(
+    mode: LayoutMode,
     term_width: int,
     term_height: int,
-    browser_visible: bool = True,
-    art_content_width: int = ART_IDEAL_WIDTH,
+    browser_visible: bool,
+    art_content_width: int,
 ) -> Layout:
-    """
-    Calculate responsive layout based on terminal dimensions.
-    
-    The layout prioritizes showing art at its ideal width (80 cols),
-    then allocates remaining space to the file browser.
-    
-    Args:
-        term_width: Terminal width in columns
-        term_height: Terminal height in rows
-        browser_visible: Whether browser panel should be shown (user preference)
-        art_content_width: Width of current art content (80 or 132)
-    
-    Returns:
-        Layout with computed dimensions for each panel
-    """
-    content_height = term_height - STATUS_HEIGHT
-    
-    # Determine mode based on width
-    # Breakpoints: 80 (art fits), 101 (art + min browser + separator), 140 (comfortable)
-    if term_width < 80:
-        mode = LayoutMode.NARROW
-    elif term_width < 101:  # 80 art + 20 browser + 1 sep = 101 minimum for split
-        mode = LayoutMode.COMPACT
-    elif term_width < 140:
-        mode = LayoutMode.SPLIT
+    # Art only, will be truncated
+    return Layout(
+        mode=mode,
+        term_width=term_width,
+        term_height=term_height,
+        browser_width=0,
+        browser_height=0,
+        art_width=term_width,
+        art_height=term_height - STATUS_HEIGHT,
+        separator_width=0,
+        status_height=STATUS_HEIGHT,
+        browser_visible=False,
+        art_needs_hscroll=True,
+    )
+
+
+def _compact_layout(
+    mode: LayoutMode,
+    term_width: int,
+    term_height: int,
+    browser_visible: bool,
+    art_content_width: int,
+) -> Layout:
+    # Art only, fits or nearly fits
+    return Layout(
+        mode=mode,
+        term_width=term_width,
+        term_height=term_height,
+        browser_width=0,
+        browser_height=0,
+        art_width=term_width,
+        art_height=term_height - STATUS_HEIGHT,
+        separator_width=0,
+        status_height=STATUS_HEIGHT,
+        browser_visible=False,
+        art_needs_hscroll=(term_width < art_content_width),
+    )
+
+
+def _split_layout(
+    mode: LayoutMode,
+    term_width: int,
+    term_height: int,
+    browser_visible: bool,
+    art_content_width: int,
+) -> Layout:
+    # Both panels, prioritize art getting exactly 80 cols
+    if browser_visible:
+        # Art gets its ideal width first, browser gets the rest
+        art_w = art_content_width
+        browser_w = term_width - art_w - SEPARATOR_WIDTH
+        # If browser too small, squeeze art
+        if browser_w < BROWSER_MIN_WIDTH:
+            browser_w = BROWSER_MIN_WIDTH
+            art_w = term_width - browser_w - SEPARATOR_WIDTH
     else:
-        mode = LayoutMode.WIDE
-    
-    # Calculate panel widths based on mode
-    if mode == LayoutMode.NARROW:
-        # Art only, will be truncated
-        return Layout(
-            mode=mode,
-            term_width=term_width,
-            term_height=term_height,
-            browser_width=0,
-            browser_height=0,
-            art_width=term_width,
-            art_height=content_height,
-            separator_width=0,
-            status_height=STATUS_HEIGHT,
-            browser_visible=False,
-            art_needs_hscroll=True,
-        )
-    
-    if mode == LayoutMode.COMPACT:
-        # Art only, fits or nearly fits
-        return Layout(
-            mode=mode,
-            term_width=term_width,
-            term_height=term_height,
-            browser_width=0,
-            browser_height=0,
-            art_width=term_width,
-            art_height=content_height,
-            separator_width=0,
-            status_height=STATUS_HEIGHT,
-            browser_visible=False,
-            art_needs_hscroll=(term_width < art_content_width),
-        )
-    
-    if mode == LayoutMode.SPLIT:
-        # Both panels, prioritize art getting exactly 80 cols
-        if browser_visible:
-            # Art gets its ideal width first, browser gets the rest
-            art_w = art_content_width
-            browser_w = term_width - art_w - SEPARATOR_WIDTH
-            # If browser too small, squeeze art
-            if browser_w < BROWSER_MIN_WIDTH:
-                browser_w = BROWSER_MIN_WIDTH
-                art_w = term_width - browser_w - SEPARATOR_WIDTH
-        else:
-            browser_w = 0
-            art_w = term_width
-        
-        return Layout(
-            mode=mode,
-            term_width=term_width,
-            term_height=term_height,
-            browser_width=browser_w,
-            browser_height=content_height if browser_w > 0 else 0,
-            art_width=art_w,
-            art_height=content_height,
-            separator_width=SEPARATOR_WIDTH if browser_w > 0 else 0,
-            status_height=STATUS_HEIGHT,
-            browser_visible=(browser_w > 0),
-            art_needs_hscroll=(art_w < art_content_width),
-        )
+        browser_w = 0
+        art_w = term_width
     
-    # WIDE mode - comfortable spacing
+    content_height = term_height - STATUS_HEIGHT
+    return Layout(
+        mode=mode,
+        term_width=term_width,
+        term_height=term_height,
+        browser_width=browser_w,
+        browser_height=content_height if browser_w > 0 else 0,
+        art_width=art_w,
+        art_height=content_height,
+        separator_width=SEPARATOR_WIDTH if browser_w > 0 else 0,
+        status_height=STATUS_HEIGHT,
+        browser_visible=(browser_w > 0),
+        art_needs_hscroll=(art_w < art_content_width),
+    )
+
+
+def _wide_layout(
+    mode: LayoutMode,
+    term_width: int,
+    term_height: int,
+    browser_visible: bool,
+    art_content_width: int,
+) -> Layout:
+    # Comfortable spacing
     if browser_visible:
         # Browser gets up to max, art gets ideal + padding
-        browser_w = min(BROWSER_MAX_WIDTH, max(BROWSER_MIN_WIDTH, (term_width - art_content_width) // 3))
+        browser_w = min(
+            BROWSER_MAX_WIDTH,
+            max(BROWSER_MIN_WIDTH, (term_width - art_content_width) // 3),
+        )
         art_w = term_width - browser_w - SEPARATOR_WIDTH
     else:
         browser_w = 0
         art_w = term_width
     
+    content_height = term_height - STATUS_HEIGHT
     return Layout(
         mode=mode,
         term_width=term_width,
@@ -181,6 +189,46 @@ def calculate_layout(
     )
 
 
+# Width breakpoints: 80 (art fits), 101 (80 art + 20 browser + 1 sep = minimum
+# for split), 140 (comfortable). bisect_right over these indexes the mode and
+# its builder.
+_BREAKPOINTS = (80, 101, 140)
+_MODES = (LayoutMode.NARROW, LayoutMode.COMPACT, LayoutMode.SPLIT, LayoutMode.WIDE)
+_BUILDERS = (_narrow_layout, _compact_layout, _split_layout, _wide_layout)
+
+
+@lru_cache(maxsize=8)
+def calculate_layout(
+    term_width: int,
+    term_height: int,
+    browser_visible: bool = True,
+    art_content_width: int = ART_IDEAL_WIDTH,
+) -> Layout:
+    """
+    Calculate responsive layout based on terminal dimensions.
+    
+    The layout prioritizes showing art at its ideal width (80 cols),
+    then allocates remaining space to the file browser.
+    
+    Args:
+        term_width: Terminal width in columns
+        term_height: Terminal height in rows
+        browser_visible: Whether browser panel should be shown (user preference)
+        art_content_width: Width of current art content (80 or 132)
+    
+    Returns:
+        Layout with computed dimensions for each panel
+    
+    Results are memoized on the arguments: they only change on resize or
+    when art of a different width is loaded, so steady-state redraws are a
+    cache hit.
+    """
+    index = bisect_right(_BREAKPOINTS, term_width)
+    return _BUILDERS[index](
+        _MODES[index], term_width, term_height, browser_visible, art_content_width
+    )
+
+
 class LayoutManager:
     """
     Manages responsive layout state for TUI applications.
@@ -196,6 +244,8 @@ class LayoutManager:
         self.active_panel = ActivePanel.BROWSER
         self._browser_pinned = True  # User preference to show browser
         self._layout: Optional[Layout] = None
+        # Inputs the current layout was computed from
+        self._last_inputs: Optional[tuple[int, int, bool, int]] = None
     
     def calculate(self, term_width: int, term_height: int) -> Layout:
         """Calculate and cache layout for current terminal size."""
@@ -203,6 +253,12 @@ class LayoutManager:
         # In split/wide modes, respect user preference
         browser_visible = self._browser_pinned
         
+        # Redraws without a resize, toggle or art change reuse the layout
+        inputs = (term_width, term_height, browser_visible, self.art_content_width)
+        if inputs == self._last_inputs and self._layout is not None:
+            return self._layout
+        self._last_inputs = inputs
+        
         self._layout = calculate_layout(
             term_width=term_width,
             term_height=term_height,
@@ -211,7 +267,7 @@ class LayoutManager:
         )
         
         # Auto-adjust active panel if browser becomes hidden
-        if not self._layout.browser_visible and self.active_panel == ActivePanel.BROWSER:
+        if not self._layout.browser_visible and self.active_panel is ActivePanel.BROWSER:
             self.active_panel = ActivePanel.ART
         
         return self._layout
@@ -240,7 +296,7 @@ class LayoutManager:
         if self._layout and self._layout.browser_visible:
             self.active_panel = (
                 ActivePanel.ART 
-                if self.active_panel == ActivePanel.BROWSER 
+                if self.active_panel is ActivePanel.BROWSER 
                 else ActivePanel.BROWSER
             )
         return self.active_panel
@@ -251,8 +307,8 @@ class LayoutManager:
     
     @property
     def browser_focused(self) -> bool:
-        return self.active_panel == ActivePanel.BROWSER
+        return self.active_panel is ActivePanel.BROWSER
     
     @property
     def art_focused(self) -> bool:
-        return self.active_panel == ActivePanel.ART
+        return self.active_panel is ActivePanel.ART
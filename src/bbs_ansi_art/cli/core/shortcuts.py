@@ -7,6 +7,7 @@ and handler names, making them easy to modify and use for generating help menus.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Callable, Optional
@@ -24,13 +25,13 @@ class ShortcutContext(Enum):
     TEXT_INPUT = auto()      # In text input fields
 
 
-@dataclass
+@dataclass(slots=True)
 class ShortcutDef:
     """Definition of a keyboard shortcut.
     
     Attributes:
         id: Unique identifier for the shortcut
-        keys: List of keys/chars that trigger this shortcut
+        keys: Keys/chars that trigger this shortcut
         label: Short label for status bar (e.g., "Save")
         description: Longer description for help menu
         context: Context(s) where this shortcut is active
@@ -39,13 +40,21 @@ class ShortcutDef:
         enabled: Whether the shortcut is currently enabled
     """
     id: str
-    keys: list[str | Key]
+    keys: tuple[str | Key, ...]
     label: str
     description: str
-    context: list[ShortcutContext] = field(default_factory=lambda: [ShortcutContext.GLOBAL])
+    context: tuple[ShortcutContext, ...] = (ShortcutContext.GLOBAL,)
     handler: str = ""
     category: str = "General"
     enabled: bool = True
+    _key_display: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Keys don't change after construction, so build the display once
+        self._key_display = "/".join(
+            _key_to_display(key) if isinstance(key, Key) else key
+            for key in self.keys
+        )
     
     def matches(self, event: KeyEvent) -> bool:
         """Check if a key event matches this shortcut."""
@@ -63,41 +72,47 @@ class ShortcutDef:
     @property
     def key_display(self) -> str:
         """Get display string for the keys."""
-        displays = []
-        for key in self.keys:
-            if isinstance(key, Key):
-                displays.append(_key_to_display(key))
-            else:
-                displays.append(key)
-        return "/".join(displays)
+        return self._key_display
+
+
+# Display strings for every Key; keys without a symbol show their name
+_KEY_DISPLAY: dict[Key, str] = {key: key.name for key in Key}
+_KEY_DISPLAY.update({
+    Key.UP: "↑",
+    Key.DOWN: "↓",
+    Key.LEFT: "←",
+    Key.RIGHT: "→",
+    Key.ENTER: "Enter",
+    Key.ESCAPE: "Esc",
+    Key.TAB: "Tab",
+    Key.BACKSPACE: "Bksp",
+    Key.HOME: "Home",
+    Key.END: "End",
+    Key.PAGE_UP: "PgUp",
+    Key.PAGE_DOWN: "PgDn",
+    Key.DELETE: "Del",
+    Key.INSERT: "Ins",
+    Key.F1: "F1",
+    Key.F2: "F2",
+    Key.F3: "F3",
+    Key.F4: "F4",
+    Key.F5: "F5",
+    Key.F10: "F10",
+    Key.F12: "F12",
+})
 
 
 def _key_to_display(key: Key) -> str:
     """Convert a Key enum to display string."""
-    display_map = {
-        Key.UP: "↑",
-        Key.DOWN: "↓",
-        Key.LEFT: "←",
-        Key.RIGHT: "→",
-        Key.ENTER: "Enter",
-        Key.ESCAPE: "Esc",
-        Key.TAB: "Tab",
-        Key.BACKSPACE: "Bksp",
-        Key.HOME: "Home",
-        Key.END: "End",
-        Key.PAGE_UP: "PgUp",
-        Key.PAGE_DOWN: "PgDn",
-        Key.DELETE: "Del",
-        Key.INSERT: "Ins",
-        Key.F1: "F1",
-        Key.F2: "F2",
-        Key.F3: "F3",
-        Key.F4: "F4",
-        Key.F5: "F5",
-        Key.F10: "F10",
-        Key.F12: "F12",
-    }
-    return display_map.get(key, key.name)
+    return _KEY_DISPLAY[key]
+
+
+# Help menu category order; unlisted categories sort last
+_CATEGORY_PRIORITY: dict[str, int] = {
+    name: i for i, name in enumerate(
+        ["Navigation", "Drawing", "Colors", "Palette", "File", "General"]
+    )
+}
 
 
 class ShortcutRegistry:
@@ -113,10 +128,10 @@ class ShortcutRegistry:
         registry = ShortcutRegistry()
         registry.register(ShortcutDef(
             id="save",
-            keys=["s"],
+            keys=("s",),
             label="Save",
             description="Save the current document",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="handle_save",
             category="File",
         ))
@@ -129,28 +144,67 @@ class ShortcutRegistry:
     
     def __init__(self) -> None:
         self._shortcuts: dict[str, ShortcutDef] = {}
-        self._by_context: dict[ShortcutContext, list[ShortcutDef]] = {
-            ctx: [] for ctx in ShortcutContext
-        }
+        # Per-context tables are created on first registration; read paths
+        # use .get() so looking up an empty context doesn't add entries.
+        self._by_context: defaultdict[ShortcutContext, list[ShortcutDef]] = defaultdict(list)
+        # Per-context index from trigger (Key or char) to shortcuts, in
+        # registration order, so match() is a dict lookup per context
+        self._key_index: defaultdict[ShortcutContext, dict[str | Key, list[ShortcutDef]]] = (
+            defaultdict(dict)
+        )
+        # Sorted help categories per context, rebuilt after registration
+        self._sorted_categories: dict[ShortcutContext, tuple[str, ...]] = {}
+        # Builders for contexts whose shortcuts haven't been created yet
+        self._loaders: dict[ShortcutContext, Callable[[], list[ShortcutDef]]] = {}
     
     def register(self, shortcut: ShortcutDef) -> None:
         """Register a shortcut definition."""
         self._shortcuts[shortcut.id] = shortcut
+        self._sorted_categories.clear()
         for ctx in shortcut.context:
             self._by_context[ctx].append(shortcut)
+            index = self._key_index[ctx]
+            for key in shortcut.keys:
+                index.setdefault(key, []).append(shortcut)
     
     def register_many(self, shortcuts: list[ShortcutDef]) -> None:
         """Register multiple shortcuts at once."""
         for shortcut in shortcuts:
             self.register(shortcut)
     
+    def register_lazy(
+        self,
+        context: ShortcutContext,
+        builder: Callable[[], list[ShortcutDef]]
+    ) -> None:
+        """Register a builder for a context's shortcuts, run on first use.
+        
+        The builder is called (once) the first time the context is matched
+        or queried, or when every shortcut is needed (get, all_shortcuts, etc.).
+        """
+        self._loaders[context] = builder
+    
+    def _load(self, context: ShortcutContext) -> None:
+        """Run the pending builder for a context, if any."""
+        builder = self._loaders.pop(context, None)
+        if builder is not None:
+            self.register_many(builder())
+    
+    def _load_all(self) -> None:
+        """Run every pending builder."""
+        while self._loaders:
+            self._load(next(iter(self._loaders)))
+    
     def get(self, shortcut_id: str) -> Optional[ShortcutDef]:
         """Get a shortcut by ID."""
+        self._load_all()
         return self._shortcuts.get(shortcut_id)
     
     def match(self, event: KeyEvent, *contexts: ShortcutContext) -> Optional[ShortcutDef]:
         """Find a shortcut matching the event in the given contexts.
         
+        Contexts are searched in the order given, then GLOBAL.
+        
         Args:
             event: The key event to match
             contexts: Contexts to search in (defaults to GLOBAL)
@@ -158,15 +212,19 @@ class ShortcutRegistry:
         Returns:
             Matching ShortcutDef or None
         """
-        if not contexts:
-            contexts = (ShortcutContext.GLOBAL,)
+        trigger = event.key if event.key is not None else event.char
+        if trigger is None:
+            return None
         
         # Always include GLOBAL context
-        search_contexts = set(contexts) | {ShortcutContext.GLOBAL}
-        
-        for ctx in search_contexts:
-            for shortcut in self._by_context[ctx]:
-                if shortcut.matches(event):
+        for ctx in (*contexts, ShortcutContext.GLOBAL):
+            if ctx in self._loaders:
+                self._load(ctx)
+            index = self._key_index.get(ctx)
+            if index is None:
+                continue
+            for shortcut in index.get(trigger, ()):
+                if shortcut.enabled:
                     return shortcut
         return None
     
@@ -180,9 +238,11 @@ class ShortcutRegistry:
         Returns:
             List of ShortcutDef objects
         """
-        result = list(self._by_context[context])
+        self._load(context)
+        result = list(self._by_context.get(context, ()))
         if include_global and context != ShortcutContext.GLOBAL:
-            result.extend(self._by_context[ShortcutContext.GLOBAL])
+            self._load(ShortcutContext.GLOBAL)
+            result.extend(self._by_context.get(ShortcutContext.GLOBAL, ()))
         return result
     
     def get_by_category(self, context: ShortcutContext) -> dict[str, list[ShortcutDef]]:
@@ -195,12 +255,10 @@ class ShortcutRegistry:
             Dict mapping category names to lists of shortcuts
         """
         shortcuts = self.get_for_context(context)
-        by_category: dict[str, list[ShortcutDef]] = {}
+        by_category: defaultdict[str, list[ShortcutDef]] = defaultdict(list)
         for shortcut in shortcuts:
-            if shortcut.category not in by_category:
-                by_category[shortcut.category] = []
             by_category[shortcut.category].append(shortcut)
-        return by_category
+        return dict(by_category)
     
     def generate_help_text(self, context: ShortcutContext, width: int = 37) -> list[str]:
         """Generate help text for a context.
@@ -216,11 +274,13 @@ class ShortcutRegistry:
         lines = []
         
         # Sort categories for consistent ordering
-        category_order = ["Navigation", "Drawing", "Colors", "Palette", "File", "General"]
-        sorted_categories = sorted(
-            by_category.keys(),
-            key=lambda c: category_order.index(c) if c in category_order else 999
-        )
+        sorted_categories = self._sorted_categories.get(context)
+        if sorted_categories is None:
+            sorted_categories = tuple(sorted(
+                by_category,
+                key=lambda c: _CATEGORY_PRIORITY.get(c, 999)
+            ))
+            self._sorted_categories[context] = sorted_categories
         
         for category in sorted_categories:
             shortcuts = by_category[category]
@@ -268,95 +328,105 @@ class ShortcutRegistry:
     
     def set_enabled(self, shortcut_id: str, enabled: bool) -> None:
         """Enable or disable a shortcut."""
+        self._load_all()
         if shortcut_id in self._shortcuts:
             self._shortcuts[shortcut_id].enabled = enabled
     
     def all_shortcuts(self) -> list[ShortcutDef]:
         """Get all registered shortcuts."""
+        self._load_all()
         return list(self._shortcuts.values())
 
 
+# Color quick-select shortcuts as (id, key, handler, description);
+# keys 1-9 select colors 0-8 and 0 selects color 9
+_COLOR_QUICK_SELECTS: tuple[tuple[str, str, str, str], ...] = tuple(
+    (f"color_{num}", num, f"select_color_{idx}", f"Select color {idx}")
+    for num, idx in zip("0123456789", (9, 0, 1, 2, 3, 4, 5, 6, 7, 8))
+)
+
+
 # =============================================================================
 # Default Shortcuts - The single source of truth for all app shortcuts
 # =============================================================================
 
-def create_default_shortcuts() -> ShortcutRegistry:
-    """Create the default shortcut registry with all application shortcuts."""
-    registry = ShortcutRegistry()
+def _editor_shortcuts() -> list[ShortcutDef]:
+    """Shortcuts active in the art editor."""
+    shortcuts: list[ShortcutDef] = []
     
     # -------------------------------------------------------------------------
     # Navigation Shortcuts
     # -------------------------------------------------------------------------
-    registry.register_many([
+    shortcuts.extend([
         ShortcutDef(
             id="nav_up",
-            keys=[Key.UP, "k"],
+            keys=(Key.UP, "k"),
             label="",
             description="Move cursor up",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="move_up",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_down",
-            keys=[Key.DOWN, "j"],
+            keys=(Key.DOWN, "j"),
             label="",
             description="Move cursor down",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="move_down",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_left",
-            keys=[Key.LEFT, "h"],
+            keys=(Key.LEFT, "h"),
             label="",
             description="Move cursor left",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="move_left",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_right",
-            keys=[Key.RIGHT, "l"],
+            keys=(Key.RIGHT, "l"),
             label="",
             description="Move cursor right",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="move_right",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_home",
-            keys=[Key.HOME],
+            keys=(Key.HOME,),
             label="",
             description="Go to line start",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="move_home",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_end",
-            keys=[Key.END],
+            keys=(Key.END,),
             label="",
             description="Go to line end",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="move_end",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_page_up",
-            keys=[Key.PAGE_UP],
+            keys=(Key.PAGE_UP,),
             label="",
             description="Page up",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="page_up",
             category="Navigation",
         ),
         ShortcutDef(
             id="nav_page_down",
-            keys=[Key.PAGE_DOWN],
+            keys=(Key.PAGE_DOWN,),
             label="",
             description="Page down",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="page_down",
             category="Navigation",
         ),
@@ -365,31 +435,31 @@ def create_default_shortcuts() -> ShortcutRegistry:
     # -------------------------------------------------------------------------
     # Drawing Shortcuts
     # -------------------------------------------------------------------------
-    registry.register_many([
+    shortcuts.extend([
         ShortcutDef(
             id="draw",
-            keys=[" ", Key.ENTER],
+            keys=(" ", Key.ENTER),
             label="Draw",
             description="Paint pixel",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="draw_at_cursor",
             category="Drawing",
         ),
         ShortcutDef(
             id="draw_advance",
-            keys=["d"],
+            keys=("d",),
             label="",
             description="Paint and move right",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="draw_and_advance",
             category="Drawing",
         ),
         ShortcutDef(
             id="erase",
-            keys=["x"],
+            keys=("x",),
             label="",
             description="Erase pixel",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="erase_at_cursor",
             category="Drawing",
         ),
@@ -398,242 +468,264 @@ def create_default_shortcuts() -> ShortcutRegistry:
     # -------------------------------------------------------------------------
     # Color Shortcuts
     # -------------------------------------------------------------------------
-    registry.register_many([
+    shortcuts.extend([
         ShortcutDef(
             id="color_prev",
-            keys=["["],
+            keys=("[",),
             label="",
             description="Previous color",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="cycle_color_prev",
             category="Colors",
         ),
         ShortcutDef(
             id="color_next",
-            keys=["]"],
+            keys=("]",),
             label="",
             description="Next color",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="cycle_color_next",
             category="Colors",
         ),
         ShortcutDef(
             id="eyedropper",
-            keys=["i"],
+            keys=("i",),
             label="Pick",
             description="Sample color from canvas",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="enter_eyedropper",
             category="Colors",
         ),
     ])
     
     # Color quick-select (1-9, 0)
-    for i in range(10):
-        num = str(i) if i > 0 else "0"
-        color_idx = i - 1 if i > 0 else 9  # 1-9 map to 0-8, 0 maps to 9
-        registry.register(ShortcutDef(
-            id=f"color_{num}",
-            keys=[num],
+    shortcuts.extend([
+        ShortcutDef(
+            id=shortcut_id,
+            keys=(num,),
             label="",
-            description=f"Select color {color_idx}",
-            context=[ShortcutContext.EDITOR],
-            handler=f"select_color_{color_idx}",
+            description=description,
+            context=(ShortcutContext.EDITOR,),
+            handler=handler,
             category="Colors",
-        ))
+        )
+        for shortcut_id, num, handler, description in _COLOR_QUICK_SELECTS
+    ])
     
     # -------------------------------------------------------------------------
     # Palette Shortcuts
     # -------------------------------------------------------------------------
-    registry.register_many([
+    shortcuts.extend([
         ShortcutDef(
             id="palette_toggle",
-            keys=["p"],
+            keys=("p",),
             label="Palette",
             description="Toggle palette panel",
-            context=[ShortcutContext.EDITOR],
+            context=(ShortcutContext.EDITOR,),
             handler="toggle_palette",
             category="Palette",
         ),
+    ])
+    
+    # -------------------------------------------------------------------------
+    # File Shortcuts
+    # -------------------------------------------------------------------------
+    shortcuts.extend([
+        ShortcutDef(
+            id="save",
+            keys=("s",),
+            label="Save",
+            description="Save document",
+            context=(ShortcutContext.EDITOR,),
+            handler="save_document",
+            category="File",
+        ),
+    ])
+    
+    return shortcuts
+
+
+def _palette_shortcuts() -> list[ShortcutDef]:
+    """Shortcuts active in the palette widget."""
+    return [
         ShortcutDef(
             id="palette_edit",
-            keys=["e"],
+            keys=("e",),
             label="Edit",
             description="Edit current color",
-            context=[ShortcutContext.PALETTE],
+            context=(ShortcutContext.PALETTE,),
             handler="open_color_editor",
             category="Palette",
         ),
         ShortcutDef(
             id="palette_add",
-            keys=["+", "a"],
+            keys=("+", "a"),
             label="Add",
             description="Add to saved swatches",
-            context=[ShortcutContext.PALETTE],
+            context=(ShortcutContext.PALETTE,),
             handler="add_to_saved",
             category="Palette",
         ),
         ShortcutDef(
             id="palette_remove",
-            keys=[Key.DELETE, "-"],
+            keys=(Key.DELETE, "-"),
             label="Remove",
             description="Remove from saved",
-            context=[ShortcutContext.PALETTE],
+            context=(ShortcutContext.PALETTE,),
             handler="remove_from_saved",
             category="Palette",
         ),
         ShortcutDef(
             id="palette_section_next",
-            keys=[Key.TAB],
+            keys=(Key.TAB,),
             label="",
             description="Next section",
-            context=[ShortcutContext.PALETTE],
+            context=(ShortcutContext.PALETTE,),
             handler="next_section",
             category="Palette",
         ),
-    ])
-    
-    # -------------------------------------------------------------------------
-    # Color Editor Shortcuts
-    # -------------------------------------------------------------------------
-    registry.register_many([
+    ]
+
+
+def _color_editor_shortcuts() -> list[ShortcutDef]:
+    """Shortcuts active in the color editor modal."""
+    return [
         ShortcutDef(
             id="editor_mode_toggle",
-            keys=[Key.TAB],
+            keys=(Key.TAB,),
             label="",
             description="Toggle RGB/HSL mode",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="toggle_color_mode",
             category="Color Editor",
         ),
         ShortcutDef(
             id="editor_apply",
-            keys=[Key.ENTER],
+            keys=(Key.ENTER,),
             label="Apply",
             description="Apply color",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="apply_color",
             category="Color Editor",
         ),
         ShortcutDef(
             id="editor_cancel",
-            keys=[Key.ESCAPE],
+            keys=(Key.ESCAPE,),
             label="Cancel",
             description="Cancel editing",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="cancel_editor",
             category="Color Editor",
         ),
         ShortcutDef(
             id="editor_channel_up",
-            keys=[Key.UP],
+            keys=(Key.UP,),
             label="",
             description="Previous channel",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="prev_channel",
             category="Color Editor",
         ),
         ShortcutDef(
             id="editor_channel_down",
-            keys=[Key.DOWN],
+            keys=(Key.DOWN,),
             label="",
             description="Next channel",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="next_channel",
             category="Color Editor",
         ),
         ShortcutDef(
             id="editor_value_dec",
-            keys=[Key.LEFT],
+            keys=(Key.LEFT,),
             label="",
             description="Decrease value",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="decrease_value",
             category="Color Editor",
         ),
         ShortcutDef(
             id="editor_value_inc",
-            keys=[Key.RIGHT],
+            keys=(Key.RIGHT,),
             label="",
             description="Increase value",
-            context=[ShortcutContext.COLOR_EDITOR],
+            context=(ShortcutContext.COLOR_EDITOR,),
             handler="increase_value",
             category="Color Editor",
         ),
-    ])
-    
-    # -------------------------------------------------------------------------
-    # Eyedropper Mode Shortcuts
-    # -------------------------------------------------------------------------
-    registry.register_many([
+    ]
+
+
+def _eyedropper_shortcuts() -> list[ShortcutDef]:
+    """Shortcuts active in eyedropper mode."""
+    return [
         ShortcutDef(
             id="eyedropper_pick",
-            keys=[Key.ENTER, " "],
+            keys=(Key.ENTER, " "),
             label="Pick",
             description="Pick color",
-            context=[ShortcutContext.EYEDROPPER],
+            context=(ShortcutContext.EYEDROPPER,),
             handler="pick_color",
             category="Eyedropper",
         ),
         ShortcutDef(
             id="eyedropper_pick_save",
-            keys=["+"],
+            keys=("+",),
             label="Pick+Save",
             description="Pick and save to swatches",
-            context=[ShortcutContext.EYEDROPPER],
+            context=(ShortcutContext.EYEDROPPER,),
             handler="pick_and_save",
             category="Eyedropper",
         ),
         ShortcutDef(
             id="eyedropper_cancel",
-            keys=[Key.ESCAPE, "i"],
+            keys=(Key.ESCAPE, "i"),
             label="Cancel",
             description="Exit eyedropper mode",
-            context=[ShortcutContext.EYEDROPPER],
+            context=(ShortcutContext.EYEDROPPER,),
             handler="exit_eyedropper",
             category="Eyedropper",
         ),
-    ])
+    ]
+
+
+def create_default_shortcuts() -> ShortcutRegistry:
+    """Create the default shortcut registry with all application shortcuts.
+    
+    Global shortcuts are registered immediately; each other context's
+    shortcuts are built the first time that context is used.
+    """
+    registry = ShortcutRegistry()
     
     # -------------------------------------------------------------------------
-    # File Shortcuts
+    # Global Shortcuts (File, General)
     # -------------------------------------------------------------------------
     registry.register_many([
-        ShortcutDef(
-            id="save",
-            keys=["s"],
-            label="Save",
-            description="Save document",
-            context=[ShortcutContext.EDITOR],
-            handler="save_document",
-            category="File",
-        ),
         ShortcutDef(
             id="quit",
-            keys=["Q"],
+            keys=("Q",),
             label="Quit",
             description="Quit editor",
-            context=[ShortcutContext.GLOBAL],
+            context=(ShortcutContext.GLOBAL,),
             handler="quit",
             category="File",
         ),
-    ])
-    
-    # -------------------------------------------------------------------------
-    # General Shortcuts
-    # -------------------------------------------------------------------------
-    registry.register_many([
         ShortcutDef(
             id="help",
-            keys=["?"],
+            keys=("?",),
             label="Help",
             description="Show/hide help",
-            context=[ShortcutContext.GLOBAL],
+            context=(ShortcutContext.GLOBAL,),
             handler="toggle_help",
             category="General",
         ),
     ])
     
+    registry.register_lazy(ShortcutContext.EDITOR, _editor_shortcuts)
+    registry.register_lazy(ShortcutContext.PALETTE, _palette_shortcuts)
+    registry.register_lazy(ShortcutContext.COLOR_EDITOR, _color_editor_shortcuts)
+    registry.register_lazy(ShortcutContext.EYEDROPPER, _eyedropper_shortcuts)
+    
     return registry
 
 
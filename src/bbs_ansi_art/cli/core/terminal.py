@@ -3,10 +3,154 @@
 from __future__ import annotations
 
 import os
+import signal
 import sys
+import time
+from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Iterator
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import termios
+    _HAS_TERMIOS = True
+except ImportError:
+    # Windows - raw_mode() is a no-op
+    _HAS_TERMIOS = False
+
+# Pre-encoded escape sequences
+CLEAR = b'\x1b[2J\x1b[H'
+RESET = b'\x1b[0m'
+HIDE_CURSOR = b'\x1b[?25l'
+SHOW_CURSOR = b'\x1b[?25h'
+ALT_SCREEN_ON = b'\x1b[?1049h'
+ALT_SCREEN_OFF = b'\x1b[?1049l'
+
+# managed_mode() entry and exit, each sent in a single write
+_SETUP = ALT_SCREEN_ON + HIDE_CURSOR
+_TEARDOWN = SHOW_CURSOR + RESET + ALT_SCREEN_OFF
+
+
+@lru_cache(maxsize=4096)
+def _move_seq(row: int, col: int) -> bytes:
+    """Cursor-move sequence for (row, col); a screen has few distinct ones."""
+    return f'\x1b[{row};{col}H'.encode('ascii')
+
+
+if _HAS_TERMIOS:
+    # The attribute changes tty.setraw() makes, worked out once so
+    # raw_mode() needs only one tcgetattr and one tcsetattr
+    _RAW_IFLAG_OFF = termios.BRKINT | termios.ICRNL | termios.INPCK | termios.ISTRIP | termios.IXON
+    _RAW_OFLAG_OFF = termios.OPOST
+    _RAW_CFLAG_OFF = termios.CSIZE | termios.PARENB
+    _RAW_CFLAG_ON = termios.CS8
+    _RAW_LFLAG_OFF = termios.ECHO | termios.ICANON | termios.IEXTEN | termios.ISIG
+
+
+def _raw_attrs(attrs: list[Any]) -> list[Any]:
+    """Return a raw-mode copy of a tcgetattr() attribute list."""
+    iflag, oflag, cflag, lflag, ispeed, ospeed, cc = attrs
+    cc = list(cc)
+    cc[termios.VMIN] = 1
+    cc[termios.VTIME] = 0
+    return [
+        iflag & ~_RAW_IFLAG_OFF,
+        oflag & ~_RAW_OFLAG_OFF,
+        (cflag & ~_RAW_CFLAG_OFF) | _RAW_CFLAG_ON,
+        lflag & ~_RAW_LFLAG_OFF,
+        ispeed,
+        ospeed,
+        cc,
+    ]
+
+
+# Output queued since the last flush. Outside managed_mode it is handed to
+# sys.stdout.buffer; inside, it goes straight to the stdout fd cached on
+# entry, with os.write, skipping the io stack. When that fd is not a TTY
+# (a pipe or file, e.g. under a test harness) nobody is watching frames
+# arrive, so output is held until _PIPE_BUFFER bytes have built up.
+_pending = bytearray()
+_fd: Optional[int] = None
+_buffered = False
+_PIPE_BUFFER = 64 * 1024
+
+# Large pre-encoded blocks (whole frames) queued ahead of _pending. They
+# are kept by reference and gathered with os.writev at flush time instead
+# of being copied into the bytearray.
+_chunks: list[bytes | bytearray] = []
+_chunks_len = 0
+_GATHER_MIN = 4096
+_HAS_WRITEV = hasattr(os, 'writev')
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+def _raw_write(fd: int, data: bytes | bytearray) -> None:
+    """os.write all of data, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _raw_writev(fd: int, parts: list[bytes | bytearray]) -> None:
+    """os.writev all of parts, at most _IOV_MAX at a time, retrying on short writes."""
+    views = [memoryview(part) for part in parts if part]
+    i = 0
+    while i < len(views):
+        written = os.writev(fd, views[i:i + _IOV_MAX])
+        while written:
+            size = len(views[i])
+            if written < size:
+                views[i] = views[i][written:]
+                break
+            written -= size
+            i += 1
+
+
+def _queue_chunk(data: bytes) -> None:
+    """Queue a large block behind whatever is pending, without copying it."""
+    global _pending, _chunks_len
+    if _pending:
+        _chunks.append(_pending)
+        _chunks_len += len(_pending)
+        _pending = bytearray()
+    _chunks.append(data)
+    _chunks_len += len(data)
+
+
+def _flush(force: bool = False) -> None:
+    """Send queued output to the terminal.
+    
+    With non-TTY output this only writes once enough has been queued,
+    unless force is set.
+    """
+    global _pending, _chunks, _chunks_len
+    if not (_pending or _chunks) or (
+        _buffered and not force and len(_pending) + _chunks_len < _PIPE_BUFFER
+    ):
+        return
+    data, _pending = _pending, bytearray()
+    if _chunks:
+        parts, _chunks, _chunks_len = _chunks, [], 0
+        parts.append(data)
+        if _fd is None:
+            for part in parts:
+                sys.stdout.buffer.write(part)
+            sys.stdout.flush()
+        elif _HAS_WRITEV:
+            _raw_writev(_fd, parts)
+        else:
+            _raw_write(_fd, b''.join(parts))
+    elif _fd is None:
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+    else:
+        _raw_write(_fd, data)
 
 
 @dataclass(frozen=True)
@@ -16,93 +160,283 @@ class TerminalSize:
     cols: int
 
 
+# Last measured size. While managed_mode has a SIGWINCH handler installed
+# the cache stays valid until the next resize signal; otherwise (Windows,
+# or outside managed_mode) it expires after a short TTL.
+_cached_size: Optional[TerminalSize] = None
+_cached_at = 0.0
+_SIZE_TTL = 0.1
+_watching_resize = False
+# Bumped by every SIGWINCH, so size() can tell a measurement taken before
+# the resize from one taken after it
+_resize_gen = 0
+
+
+# Screen width while managed_mode is active, 0 otherwise. write() only
+# tracks the cursor across text that stays within it.
+_screen_cols = 0
+
+
+# Where the cursor is known to be (1-indexed), or None if unknown. Lets
+# move_to() drop moves to where the cursor already is. Only plain
+# printable ASCII that stays on screen keeps it known across a write.
+_cur_rc: Optional[tuple[int, int]] = None
+
+
+def _on_resize(signum: int, frame: object) -> None:
+    global _cached_size, _cur_rc, _resize_gen
+    _cached_size = None
+    _cur_rc = None
+    _resize_gen += 1
+
+
+# Read end of a pipe the signal module writes to on SIGWINCH while
+# _watch_resize() is active, so a select() on input also wakes on resize.
+_resize_fd: Optional[int] = None
+
+
+@contextmanager
+def _watch_resize() -> Iterator[None]:
+    """Invalidate the size cache on SIGWINCH for the duration (Unix only)."""
+    global _watching_resize, _cached_size, _resize_fd
+    try:
+        previous = signal.signal(signal.SIGWINCH, _on_resize)
+    except (AttributeError, ValueError):
+        # No SIGWINCH (Windows) or not the main thread: rely on the TTL
+        yield
+        return
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    previous_wakeup = signal.set_wakeup_fd(write_fd, warn_on_full_buffer=False)
+    _resize_fd = read_fd
+    _cached_size = None
+    _watching_resize = True
+    try:
+        yield
+    finally:
+        _watching_resize = False
+        signal.signal(signal.SIGWINCH, previous)
+        signal.set_wakeup_fd(previous_wakeup)
+        _resize_fd = None
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def clear() -> None:
+    """Clear screen and move cursor to home."""
+    global _cur_rc
+    _pending.extend(CLEAR)
+    _cur_rc = (1, 1)
+
+
+def reset() -> None:
+    """Reset all terminal attributes."""
+    _pending.extend(RESET)
+
+
+def hide_cursor() -> None:
+    """Hide the cursor."""
+    _pending.extend(HIDE_CURSOR)
+
+
+def show_cursor() -> None:
+    """Show the cursor."""
+    _pending.extend(SHOW_CURSOR)
+
+
+def move_to(row: int, col: int) -> None:
+    """Move cursor to position (1-indexed).
+    
+    Skipped when the cursor is already there.
+    """
+    global _cur_rc
+    if _cur_rc == (row, col):
+        return
+    _pending.extend(_move_seq(row, col))
+    _cur_rc = (row, col)
+
+
+def write(text: str) -> None:
+    """Write text to terminal (encoded as UTF-8)."""
+    global _cur_rc
+    rc = _cur_rc
+    write_bytes(text.encode('utf-8', 'replace'))
+    if rc is None or not (text.isascii() and text.isprintable()):
+        return
+    col = rc[1] + len(text)
+    if col <= _screen_cols:
+        _cur_rc = (rc[0], col)
+
+
+def write_bytes(data: bytes) -> None:
+    """Write already-encoded output to terminal.
+    
+    Large bytes objects are queued by reference, not copied; they
+    must not be changed before the next flush.
+    """
+    global _cur_rc
+    _cur_rc = None
+    if len(data) >= _GATHER_MIN and type(data) is bytes:
+        _queue_chunk(data)
+    else:
+        _pending.extend(data)
+
+
 class Terminal:
-    """Terminal I/O abstraction for TUI applications."""
+    """Terminal I/O abstraction for TUI applications.
+    
+    Output methods only queue escape sequences and text; nothing reaches
+    the terminal until flush() is called, normally once per frame. Output
+    bypasses sys.stdout's text layer, which is flushed before a session
+    starts.
+    """
 
     @staticmethod
     def size() -> TerminalSize:
-        """Get current terminal dimensions."""
+        """Get current terminal dimensions (cached between resizes)."""
+        global _cached_size, _cached_at, _screen_cols
+        # Work on a local: SIGWINCH may reset the global to None at any point
+        cached = _cached_size
+        if cached is not None and (
+            _watching_resize or time.monotonic() - _cached_at < _SIZE_TTL
+        ):
+            return cached
+        generation = _resize_gen
         try:
             size = os.get_terminal_size()
-            return TerminalSize(size.lines, size.columns)
+            cached = TerminalSize(size.lines, size.columns)
         except OSError:
-            return TerminalSize(24, 80)
+            cached = TerminalSize(24, 80)
+        # A resize landing after the ioctl makes this measurement stale;
+        # return it for now but leave the cache empty for the next call
+        if _resize_gen == generation:
+            _cached_size = cached
+            _cached_at = time.monotonic()
+        if _screen_cols:
+            _screen_cols = cached.cols
+        return cached
 
-    @staticmethod
-    def clear() -> None:
-        """Clear screen and move cursor to home."""
-        sys.stdout.write('\x1b[2J\x1b[H')
-        sys.stdout.flush()
-
-    @staticmethod
-    def reset() -> None:
-        """Reset all terminal attributes."""
-        sys.stdout.write('\x1b[0m')
-        sys.stdout.flush()
+    # The per-call output functions live at module level, where they are
+    # cheapest to call; these keep them reachable as Terminal.<name>
+    clear = staticmethod(clear)
+    reset = staticmethod(reset)
+    hide_cursor = staticmethod(hide_cursor)
+    show_cursor = staticmethod(show_cursor)
+    move_to = staticmethod(move_to)
+    write = staticmethod(write)
+    write_bytes = staticmethod(write_bytes)
 
     @staticmethod
-    def hide_cursor() -> None:
-        """Hide the cursor."""
-        sys.stdout.write('\x1b[?25l')
-        sys.stdout.flush()
+    def resize_fd() -> Optional[int]:
+        """A file descriptor that turns readable when the terminal is resized.
+        
+        Only available inside managed_mode on Unix; None otherwise. Drain it
+        after it wakes a select().
+        """
+        return _resize_fd
 
     @staticmethod
-    def show_cursor() -> None:
-        """Show the cursor."""
-        sys.stdout.write('\x1b[?25h')
-        sys.stdout.flush()
+    def move_to_bytes(row: int, col: int) -> bytes:
+        """Return the cursor-move sequence for (row, col), 1-indexed."""
+        return _move_seq(row, col)
 
     @staticmethod
-    def move_to(row: int, col: int) -> None:
-        """Move cursor to position (1-indexed)."""
-        sys.stdout.write(f'\x1b[{row};{col}H')
-        sys.stdout.flush()
+    def render_frame(frame: bytes, *, hide: bool = False) -> None:
+        """Draw a full frame from the home position in a single write.
+        
+        Attributes are reset after the frame. With hide, the cursor is
+        hidden while drawing and shown afterwards; managed_mode already
+        keeps it hidden. Queue nothing else while building the frame.
+        """
+        if hide:
+            _pending.extend(HIDE_CURSOR)
+        move_to(1, 1)
+        write_bytes(frame)
+        _pending.extend(SHOW_CURSOR + RESET if hide else RESET)
+        _flush()
 
     @staticmethod
-    def write(text: str) -> None:
-        """Write text to terminal."""
-        sys.stdout.write(text)
-        sys.stdout.flush()
+    def flush() -> None:
+        """Send all queued output to the terminal."""
+        _flush()
 
     @staticmethod
     @contextmanager
     def raw_mode() -> Iterator[None]:
-        """Context manager for raw terminal mode (Unix only)."""
+        """Context manager for raw terminal mode (Unix only).
+        
+        VMIN=1 and VTIME=0 are set, so a read of stdin blocks until at
+        least one byte arrives; wait on input with a blocking read or a
+        selector rather than polling. Does nothing where termios is
+        missing or stdin is not a TTY.
+        """
+        if not _HAS_TERMIOS:
+            # Windows or no termios - just yield
+            yield
+            return
         try:
-            import termios
-            import tty
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(fd)
-                yield
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        except ImportError:
-            # Windows or no termios - just yield
+        except (AttributeError, OSError, ValueError, termios.error):
+            # stdin redirected or replaced - nothing to put in raw mode
             yield
+            return
+        try:
+            termios.tcsetattr(fd, termios.TCSAFLUSH, _raw_attrs(old_settings))
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
     @staticmethod
     @contextmanager
     def alternate_screen() -> Iterator[None]:
-        """Use alternate screen buffer (preserves scrollback)."""
-        sys.stdout.write('\x1b[?1049h')
+        """Use alternate screen buffer (preserves scrollback).
+        
+        The switch is queued rather than written, so it reaches the
+        terminal together with the first frame.
+        """
+        # Drain anything still pending in the text layer first
         sys.stdout.flush()
+        global _cur_rc
+        _pending.extend(ALT_SCREEN_ON)
+        _cur_rc = None
         try:
             yield
         finally:
-            sys.stdout.write('\x1b[?1049l')
-            sys.stdout.flush()
-
+            _pending.extend(ALT_SCREEN_OFF)
+            _cur_rc = None
+            _flush()
+    
     @staticmethod
     @contextmanager
     def managed_mode() -> Iterator[None]:
-        """Full TUI mode: alternate screen, hidden cursor, raw input."""
-        with Terminal.alternate_screen():
-            Terminal.hide_cursor()
-            try:
-                with Terminal.raw_mode():
-                    yield
-            finally:
-                Terminal.show_cursor()
-                Terminal.reset()
+        """Full TUI mode: alternate screen, hidden cursor, raw input.
+        
+        While active, output is written to the stdout fd with os.write,
+        batched into large writes if that fd is not a TTY.
+        """
+        global _fd, _buffered, _cur_rc, _screen_cols
+        sys.stdout.flush()
+        previous_fd, previous_buffered = _fd, _buffered
+        try:
+            _fd = sys.stdout.fileno()
+            _buffered = not os.isatty(_fd)
+        except (AttributeError, OSError, ValueError):
+            pass
+        try:
+            with _watch_resize():
+                _screen_cols = Terminal.size().cols
+                # Sent along with the first frame
+                _pending.extend(_SETUP)
+                _cur_rc = None
+                try:
+                    with Terminal.raw_mode():
+                        yield
+                finally:
+                    _pending.extend(_TEARDOWN)
+                    _cur_rc = None
+                    _flush(force=True)
+        finally:
+            _fd, _buffered = previous_fd, previous_buffered
+            _screen_cols = 0
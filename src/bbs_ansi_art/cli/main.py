@@ -7,14 +7,65 @@ from typing import Optional
 
 def main() -> None:
     """Main CLI entry point."""
+    # Answer version queries before importing typer/rich
+    if sys.argv[1:2] in (["--version"], ["-V"]):
+        from bbs_ansi_art import __version__
+        print(f"bbs-ansi-art {__version__}")
+        return
+    
+    # Plain `view FILE` needs no option parsing; print it without typer
+    if _is_plain_view(sys.argv[1:]):
+        _fallback_main()
+        return
+    
     # Check for TUI dependencies
     try:
-        from bbs_ansi_art.cli.app import create_app
-        app = create_app()
-        app()
+        from bbs_ansi_art.cli.app import _sniff_subcommand, create_app
+        app = create_app(_sniff_subcommand(sys.argv[1:]))
     except ImportError:
         # Minimal fallback without typer
         _fallback_main()
+        return
+    app()
+
+
+def _is_plain_view(args: list[str]) -> bool:
+    """True for `view FILE` with no options, which the fallback handles the same way."""
+    return (
+        len(args) == 2
+        and args[0] == "view"
+        and not args[1].startswith("-")
+        and Path(args[1]).is_file()
+    )
+
+
+_FALLBACK_HELP = """\
+bbs-ansi-art - ANSI art toolkit
+
+Install CLI extras for full functionality:
+  uv pip install bbs-ansi-art[cli]
+
+Basic usage (library mode):
+  python -c "import bbs_ansi_art as ansi; print(ansi.load('art.ans').render())"
+"""
+
+
+def _fallback_view(args: list[str]) -> None:
+    """Basic view command without TUI."""
+    import bbs_ansi_art as ansi
+    doc = ansi.load(args[0])
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        print(doc.render())
+    else:
+        sys.stdout.flush()
+        stream.write(doc.render().encode("utf-8", "replace") + b"\n")
+
+
+# Commands the fallback CLI understands; each takes the arguments after its name
+_FALLBACK_COMMANDS = {
+    "view": _fallback_view,
+}
 
 
 def _fallback_main() -> None:
@@ -22,24 +73,15 @@ def _fallback_main() -> None:
     args = sys.argv[1:]
     
     if not args or args[0] in ("-h", "--help"):
-        print("bbs-ansi-art - ANSI art toolkit")
-        print()
-        print("Install CLI extras for full functionality:")
-        print("  uv pip install bbs-ansi-art[cli]")
-        print()
-        print("Basic usage (library mode):")
-        print("  python -c \"import bbs_ansi_art as ansi; print(ansi.load('art.ans').render())\"")
+        sys.stdout.write(_FALLBACK_HELP)
         return
     
-    if args[0] == "view" and len(args) > 1:
-        # Basic view command without TUI
-        import bbs_ansi_art as ansi
-        doc = ansi.load(args[1])
-        print(doc.render())
+    command = _FALLBACK_COMMANDS.get(args[0])
+    if command is not None and len(args) > 1:
+        command(args[1:])
         return
     
-    print(f"Unknown command: {args[0]}")
-    print("Install CLI extras: uv pip install bbs-ansi-art[cli]")
+    sys.stdout.write(f"Unknown command: {args[0]}\nInstall CLI extras: uv pip install bbs-ansi-art[cli]\n")
     sys.exit(1)
 
 
@@ -9,17 +9,20 @@ This module provides the main EditorApp that integrates:
 from __future__ import annotations
 
 import sys
+from collections import Counter
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
-from bbs_ansi_art.cli.core.terminal import Terminal
+from bbs_ansi_art.cli.core.terminal import RESET, Terminal
 from bbs_ansi_art.cli.core.input import InputReader, Key, KeyEvent
-from bbs_ansi_art.cli.core.ansi_text import visible_len, truncate, pad_to_width
+from bbs_ansi_art.cli.core.ansi_text import SGR_ESCAPE, visible_len, truncate, fit_to_width
 from bbs_ansi_art.cli.core.shortcuts import get_shortcut_registry, ShortcutContext
 from bbs_ansi_art.cli.widgets.base import Rect
 from bbs_ansi_art.cli.widgets.art_editor import ArtEditorWidget, ANSI_16_RGB
 from bbs_ansi_art.cli.widgets.swatch_palette import SwatchPaletteWidget, ANSI_16_PALETTE
 from bbs_ansi_art.cli.widgets.status_bar import StatusBarWidget, Shortcut
+from bbs_ansi_art.core.pixel import Pixel
 from bbs_ansi_art.edit.document import EditableDocument, DocumentFormat
 from bbs_ansi_art.edit.editable import EditMode, ColorMode
 
@@ -28,6 +31,65 @@ from bbs_ansi_art.edit.editable import EditMode, ColorMode
 PALETTE_WIDTH = 40
 MIN_EDITOR_WIDTH = 40
 STATUS_BAR_HEIGHT = 1
+_SEPARATOR = "\x1b[90m\u2502\x1b[0m"  # Between editor and palette
+
+# Input wait per loop iteration when resizes can't wake the loop: the
+# shortest while the user is active, backing off towards the longest while
+# idle. A read returns as soon as a key arrives, so the wait only bounds
+# how often an idle loop wakes up.
+POLL_TIMEOUT_MIN = 0.1
+POLL_TIMEOUT_MAX = 0.5
+POLL_BACKOFF = 1.5
+
+# Most already-queued keys applied before rendering again, so a burst (key
+# repeat, paste) costs one frame without starving the screen under a flood
+MAX_COALESCED_EVENTS = 32
+
+# Row separator for full-frame output
+_ROW_SEP = b'\r\n'
+
+# RGB -> closest palette index. Seeded with the exact palette colors (every
+# pixel of a 16-color document) and filled in as other colors are looked up.
+_CLOSEST_INDEX: dict[tuple[int, int, int], int] = {rgb: idx for idx, rgb in enumerate(ANSI_16_RGB)}
+
+
+# Help modal drawn over the editor and palette, styled bold white on dark
+# gray and reset at the end of each line
+_HELP_WIDTH = 41
+_HELP_LINES = (
+    "╭───────────────────────────────────────╮",
+    "│         EDITOR HELP  (? to close)     │",
+    "├───────────────────────────────────────┤",
+    "│  NAVIGATION                           │",
+    "│    Arrow keys / hjkl    Move cursor   │",
+    "│    Shift+Arrow          Move fast     │",
+    "│    Home / End           Line start    │",
+    "│    PgUp / PgDn          Scroll page   │",
+    "│                                       │",
+    "│  DRAWING                              │",
+    "│    d                    Draw pixel    │",
+    "│    D                    Draw mode     │",
+    "│    x                    Erase pixel   │",
+    "│    X                    Erase mode    │",
+    "│    Esc                  Exit mode     │",
+    "│                                       │",
+    "│  COLORS                               │",
+    "│    i                    Pick color    │",
+    "│    [ / ]                Cycle color   │",
+    "│    p                    Palette       │",
+    "│                                       │",
+    "│  FILE                                 │",
+    "│    s                    Save          │",
+    "│    q                    Quit          │",
+    "╰───────────────────────────────────────╯",
+)
+_HELP_STYLED = tuple(f"\x1b[1;97;48;5;236m{line}\x1b[0m" for line in _HELP_LINES)
+
+
+@cache
+def _swatches_path() -> Path:
+    """Return the saved swatches file, resolving the home directory once."""
+    return Path.home() / ".config" / "bbs-ansi-art" / "swatches.json"
 
 
 class EditorApp:
@@ -104,7 +166,14 @@ class EditorApp:
         self._palette_focused = False
         self._eyedropper_mode = False
         self._needs_redraw = True
+        self._doc_colors_dirty = False  # Republish document colors at next render
+        self._color_counts: Counter[tuple[int, int, int]] | None = None
         self._last_size: tuple[int, int] | None = None
+        # Encoded lines on screen after the last frame, for redrawing only what changed
+        self._last_frame: list[bytes] = []
+        self._last_frame_size: tuple[int, int] | None = None
+        # Last (fingerprint, width, height) and lines rendered per widget
+        self._widget_lines: dict[object, tuple[tuple[object, ...], list[str]]] = {}
         self._message: str | None = None  # Temporary message for status bar
         
         # Save prompt state
@@ -116,8 +185,7 @@ class EditorApp:
         self._quit_confirm_pending = False
         
         # Set up swatches file in user's home directory
-        swatches_path = Path.home() / ".config" / "bbs-ansi-art" / "swatches.json"
-        self.palette.set_swatches_file(swatches_path)
+        self.palette.set_swatches_file(_swatches_path())
         
         # Connect widget callbacks
         self._setup_callbacks()
@@ -152,20 +220,9 @@ class EditorApp:
                 self._message = "Eyedropper cancelled"
             self._needs_redraw = True
         
-        def get_color_at_cursor() -> tuple[int, int, int] | None:
-            """Get color at current cursor position."""
-            if self._document and self._document.canvas:
-                canvas = self._document.canvas
-                x, y = self.editor._cursor_x, self.editor._cursor_y
-                if hasattr(canvas, 'get_pixel'):
-                    pixel = canvas.get_pixel(x, y)
-                    if pixel and not pixel.transparent:
-                        return (pixel.r, pixel.g, pixel.b)
-            return None
-        
         self.palette.set_on_eyedropper_start(on_eyedropper_start)
         self.palette.set_on_eyedropper_end(on_eyedropper_end)
-        self.palette.set_eyedropper_callback(get_color_at_cursor)
+        self.palette.set_eyedropper_callback(self._get_color_at_cursor)
         
         # Sync colors from editor to palette
         def on_editor_color_change(fg_idx: int, bg_idx: int) -> None:
@@ -178,52 +235,80 @@ class EditorApp:
         # Track modifications
         def on_modified() -> None:
             self._needs_redraw = True
-            # Update document colors in palette
-            self._update_document_colors()
+            # Republish document colors once per frame, not per edit
+            self._doc_colors_dirty = True
         
         self.editor.on_modified(on_modified)
+        
+        # Keep document color counts current one edit at a time
+        def on_pixel_change(x: int, y: int, old: Pixel, new: Pixel) -> None:
+            counts = self._color_counts
+            if counts is None:
+                return
+            if not old.transparent:
+                rgb = (old.r, old.g, old.b)
+                counts[rgb] -= 1
+                if counts[rgb] <= 0:
+                    del counts[rgb]
+            if not new.transparent:
+                counts[new.r, new.g, new.b] += 1
+        
+        self.editor.on_pixel_change(on_pixel_change)
 
     def _find_closest_color(self, rgb: tuple[int, int, int]) -> int:
-        """Find the closest 16-color palette index to an RGB color."""
+        """Find the closest 16-color palette index to an RGB color.
+        
+        Uses the "redmean" weighted distance, which tracks perceived color
+        difference far better than plain RGB distance at the same cost.
+        """
+        idx = _CLOSEST_INDEX.get(rgb)
+        if idx is not None:
+            return idx
+        
         r, g, b = rgb
         best_idx = 0
         best_dist = float('inf')
         
         for idx, (pr, pg, pb) in enumerate(ANSI_16_RGB):
-            dist = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+            # Redmean scaled by 512 to stay in integers:
+            # (2 + r̄/256)·Δr² + 4·Δg² + (2 + (255 - r̄)/256)·Δb²
+            rsum = r + pr
+            dist = (
+                (1024 + rsum) * (r - pr) ** 2
+                + 2048 * (g - pg) ** 2
+                + (1534 - rsum) * (b - pb) ** 2
+            )
             if dist < best_dist:
                 best_dist = dist
                 best_idx = idx
         
+        _CLOSEST_INDEX[rgb] = best_idx
         return best_idx
     
     def _get_color_at_cursor(self) -> tuple[int, int, int] | None:
         """Get color at current cursor position."""
         if self._document and self._document.canvas:
-            canvas = self._document.canvas
-            x, y = self.editor._cursor_x, self.editor._cursor_y
-            if hasattr(canvas, 'get_pixel'):
-                pixel = canvas.get_pixel(x, y)
-                if pixel and not pixel.transparent:
-                    return (pixel.r, pixel.g, pixel.b)
+            # Both canvas kinds implement get_pixel (it is abstract on the base)
+            pixel = self._document.canvas.get_pixel(self.editor._cursor_x, self.editor._cursor_y)
+            if pixel and not pixel.transparent:
+                return (pixel.r, pixel.g, pixel.b)
         return None
     
     def _update_document_colors(self) -> None:
-        """Update palette with colors from the current document, sorted by frequency."""
+        """Recount colors in the current document and update the palette."""
+        self._color_counts = None
         if self._document and self._document.canvas:
             canvas = self._document.canvas
-            if hasattr(canvas, '_pixels'):
-                # Count color frequencies
-                color_counts: dict[tuple[int, int, int], int] = {}
-                for row in canvas._pixels:
-                    for pixel in row:
-                        if pixel and not pixel.transparent:
-                            rgb = (pixel.r, pixel.g, pixel.b)
-                            color_counts[rgb] = color_counts.get(rgb, 0) + 1
-                
-                # Sort by frequency (most used first)
-                sorted_colors = sorted(color_counts.keys(), key=lambda c: color_counts[c], reverse=True)
-                self.palette.set_document_colors(sorted_colors)
+            if hasattr(canvas, 'color_counts'):
+                self._color_counts = canvas.color_counts()
+        self._publish_document_colors()
+    
+    def _publish_document_colors(self) -> None:
+        """Update palette from the running color counts, sorted by frequency."""
+        self._doc_colors_dirty = False
+        if self._color_counts is not None:
+            # Sort by frequency (most used first)
+            self.palette.set_document_colors([rgb for rgb, _ in self._color_counts.most_common()])
 
     # -------------------------------------------------------------------------
     # Document Management
@@ -398,32 +483,63 @@ class EditorApp:
         with Terminal.managed_mode():
             Terminal.clear()
             
-            while self.running:
-                # Check for terminal resize
-                size = Terminal.size()
-                current_size = (size.cols, size.rows)
-                if current_size != self._last_size:
-                    self._last_size = current_size
-                    self._needs_redraw = True
-                
-                # Render if needed
-                if self._needs_redraw:
-                    self._render()
-                    self._needs_redraw = False
-                
-                # Handle input
-                self._handle_input()
+            # Block on input and wake on resize where possible; otherwise
+            # poll, backing off while idle
+            resize_fd = Terminal.resize_fd()
+            event_driven = resize_fd is not None and self.input.watch(resize_fd)
+            poll_timeout = POLL_TIMEOUT_MIN
+            
+            try:
+                while self.running:
+                    # Check for terminal resize
+                    size = Terminal.size()
+                    current_size = (size.cols, size.rows)
+                    if current_size != self._last_size:
+                        self._last_size = current_size
+                        self._needs_redraw = True
+                    
+                    # Render if needed
+                    if self._needs_redraw:
+                        self._render()
+                        self._needs_redraw = False
+                    
+                    # Handle input
+                    got_key = self._handle_input(None if event_driven else poll_timeout)
+                    if not event_driven:
+                        # Poll less often the longer we sit idle
+                        backoff = min(POLL_TIMEOUT_MAX, poll_timeout * POLL_BACKOFF)
+                        poll_timeout = POLL_TIMEOUT_MIN if got_key else backoff
+            finally:
+                if event_driven and resize_fd is not None:
+                    self.input.unwatch(resize_fd)
+                self.input.close()
 
     # -------------------------------------------------------------------------
     # Input Handling
     # -------------------------------------------------------------------------
 
-    def _handle_input(self) -> None:
-        """Process keyboard input."""
-        event = self.input.read(timeout=0.1)
-        if event is None:
-            return
+    def _handle_input(self, timeout: Optional[float] = POLL_TIMEOUT_MIN) -> bool:
+        """Wait up to timeout (None: until woken) for a key and process it.
         
+        Keys already queued behind it are processed too, up to
+        MAX_COALESCED_EVENTS, so they share one render. Returns True if a
+        key arrived.
+        """
+        event = self.input.read(timeout=timeout)
+        if event is None:
+            return False
+        self._handle_event(event)
+        for _ in range(MAX_COALESCED_EVENTS):
+            if not self.running:
+                break
+            event = self.input.read(timeout=0)
+            if event is None:
+                break
+            self._handle_event(event)
+        return True
+    
+    def _handle_event(self, event: KeyEvent) -> None:
+        """Process a single key event."""
         # Handle save prompt input first if active
         if self._save_prompt_active:
             self._handle_save_prompt_input(event)
@@ -636,6 +752,9 @@ class EditorApp:
         """Render all widgets to the screen."""
         size = Terminal.size()
         
+        if self._doc_colors_dirty:
+            self._publish_document_colors()
+        
         # Calculate layout
         palette_width = PALETTE_WIDTH if self._palette_visible else 0
         editor_width = max(MIN_EDITOR_WIDTH, size.cols - palette_width - 1)  # -1 for separator
@@ -651,28 +770,25 @@ class EditorApp:
         
         # Editor bounds
         editor_bounds = Rect(0, 0, editor_width, content_height)
-        editor_lines = self.editor.render(editor_bounds)
+        editor_lines = self._render_widget(self.editor, editor_bounds)
         
         # Palette bounds (if visible)
         palette_lines: list[str] = []
         if self._palette_visible and palette_width > 0:
             palette_bounds = Rect(0, 0, palette_width, content_height)
-            palette_lines = self.palette.render(palette_bounds)
+            palette_lines = self._render_widget(self.palette, palette_bounds)
         
         # Compose each row: editor | separator | palette
         for y in range(content_height):
             editor_line = editor_lines[y] if y < len(editor_lines) else ""
             
             # Ensure editor line has exact width
-            editor_line = pad_to_width(truncate(editor_line, editor_width), editor_width)
+            editor_line = fit_to_width(editor_line, editor_width)
             
             if self._palette_visible and palette_width > 0:
                 palette_line = palette_lines[y] if y < len(palette_lines) else ""
                 palette_line = truncate(palette_line, palette_width)
-                
-                # Separator character
-                sep = "\x1b[90m\u2502\x1b[0m"
-                combined = f"{editor_line}{sep}{palette_line}\x1b[K"
+                combined = f"{editor_line}{_SEPARATOR}{palette_line}\x1b[K"
             else:
                 combined = f"{editor_line}\x1b[K"
             
@@ -694,13 +810,52 @@ class EditorApp:
             output_lines.extend(status_lines)
         
         # Output all at once to minimize flicker
-        Terminal.move_to(1, 1)
-        sys.stdout.write('\r\n'.join(output_lines))
-        sys.stdout.flush()
+        self._write_frame(output_lines, (size.cols, size.rows))
         
         # Clear temporary message after display
         self._message = None
     
+    def _render_widget(
+        self,
+        widget: ArtEditorWidget | SwatchPaletteWidget,
+        bounds: Rect
+    ) -> list[str]:
+        """Render a widget, reusing its last lines while its state is unchanged."""
+        key = (widget.fingerprint(), bounds.width, bounds.height)
+        cached = self._widget_lines.get(widget)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        lines = widget.render(bounds)
+        self._widget_lines[widget] = (key, lines)
+        return lines
+    
+    def _write_frame(self, lines: list[str], size: tuple[int, int]) -> None:
+        """Write a composed frame, redrawing only the rows that changed.
+        
+        The whole frame is written after a resize or when the number of
+        rows changes; otherwise each changed row is rewritten in place.
+        """
+        # Encoding line by line is cheaper than encoding one joined string
+        encoded = [line.encode('utf-8', 'replace') for line in lines]
+        previous = self._last_frame
+        self._last_frame = encoded
+        if size != self._last_frame_size or len(previous) != len(encoded):
+            self._last_frame_size = size
+            Terminal.render_frame(_ROW_SEP.join(encoded))
+            return
+        
+        buf = bytearray()
+        for row, (old, new) in enumerate(zip(previous, encoded), 1):
+            if old != new:
+                # Rows no longer follow each other, so don't inherit attributes
+                buf += Terminal.move_to_bytes(row, 1)
+                buf += RESET
+                buf += new
+        if buf:
+            buf += RESET
+            Terminal.write_bytes(bytes(buf))
+            Terminal.flush()
+    
     def _render_save_prompt(self, width: int) -> str:
         """Render the save filename prompt."""
         prompt = "Save as: "
@@ -754,53 +909,53 @@ class EditorApp:
         Returns:
             Substring from visual position start to end, with ANSI codes intact
         """
-        import re
-        # Pattern matches ANSI escape sequences
-        ansi_pattern = re.compile(r'\x1b\[[0-9;]*m')
-        
+        match_sgr = SGR_ESCAPE.match
         result = []
+        active_codes = []  # Codes before the slice, reapplied ahead of its first char
         visual_pos = 0
         i = 0
-        active_codes = []  # Track active ANSI codes to reapply
-        
-        while i < len(s):
-            # Check for ANSI escape sequence
-            match = ansi_pattern.match(s, i)
-            if match:
-                code = match.group()
-                # Track the code (reset clears all)
-                if code == '\x1b[0m':
-                    active_codes = []
-                else:
-                    active_codes.append(code)
-                # Include codes that appear before or within our slice
-                if visual_pos <= end:
-                    if visual_pos >= start or (result and visual_pos < start):
-                        pass  # Will be handled below
+        n = len(s)
+        
+        while i < n:
+            # Plain text runs up to the next escape; take its overlap in one slice
+            run_end = s.find('\x1b', i)
+            if run_end < 0:
+                run_end = n
+            elif run_end == i:
+                match = match_sgr(s, i)
+                if match:
+                    code = match.group()
                     if visual_pos < start:
-                        pass  # Keep tracking but don't add yet
-                    else:
+                        if code == '\x1b[0m':
+                            active_codes = []
+                        else:
+                            active_codes.append(code)
+                    elif visual_pos <= end:
                         result.append(code)
-                i = match.end()
-            else:
-                # Regular character
-                if start <= visual_pos < end:
-                    # First char? Prepend active codes
-                    if not result and active_codes:
-                        result.extend(active_codes)
-                    result.append(s[i])
-                visual_pos += 1
-                i += 1
-                
-                if visual_pos >= end:
-                    break
+                    i = match.end()
+                    continue
+                # Not an SGR sequence, so the ESC is an ordinary character
+                run_end = i + 1
+            
+            lo = max(start - visual_pos, 0)
+            hi = min(end - visual_pos, run_end - i)
+            if lo < hi:
+                if not result and active_codes:
+                    result.extend(active_codes)
+                result.append(s[i + lo:i + hi])
+            visual_pos += run_end - i
+            i = run_end
+            
+            if visual_pos >= end:
+                break
         
         return ''.join(result)
 
     def _ansi_visual_len(self, s: str) -> int:
         """Get visual length of string (excluding ANSI codes)."""
-        import re
-        return len(re.sub(r'\x1b\[[0-9;]*m', '', s))
+        if '\x1b' not in s:
+            return len(s)
+        return len(SGR_ESCAPE.sub('', s))
 
     def _overlay_help_fullscreen(self, lines: list[str], width: int, height: int) -> list[str]:
         """Overlay help modal centered on full screen.
@@ -808,41 +963,9 @@ class EditorApp:
         This renders the help at the full-screen level after composition,
         so it displays correctly over editor + palette.
         """
-        # Style: bold white on dark gray background
-        style = "\x1b[1;97;48;5;236m"
-        reset = "\x1b[0m"
-        
-        help_content = [
-            "╭───────────────────────────────────────╮",
-            "│         EDITOR HELP  (? to close)     │",
-            "├───────────────────────────────────────┤",
-            "│  NAVIGATION                           │",
-            "│    Arrow keys / hjkl    Move cursor   │",
-            "│    Shift+Arrow          Move fast     │",
-            "│    Home / End           Line start    │",
-            "│    PgUp / PgDn          Scroll page   │",
-            "│                                       │",
-            "│  DRAWING                              │",
-            "│    d                    Draw pixel    │",
-            "│    D                    Draw mode     │",
-            "│    x                    Erase pixel   │",
-            "│    X                    Erase mode    │",
-            "│    Esc                  Exit mode     │",
-            "│                                       │",
-            "│  COLORS                               │",
-            "│    i                    Pick color    │",
-            "│    [ / ]                Cycle color   │",
-            "│    p                    Palette       │",
-            "│                                       │",
-            "│  FILE                                 │",
-            "│    s                    Save          │",
-            "│    q                    Quit          │",
-            "╰───────────────────────────────────────╯",
-        ]
-        
         # Calculate centered position
-        help_width = 41  # Width of the box
-        help_height = len(help_content)
+        help_width = _HELP_WIDTH
+        help_height = len(_HELP_STYLED)
         
         start_x = max(0, (width - help_width) // 2)
         start_y = max(0, (height - help_height) // 2)
@@ -853,7 +976,7 @@ class EditorApp:
         while len(result) < height:
             result.append(" " * width)
         
-        for i, help_line in enumerate(help_content):
+        for i, help_line in enumerate(_HELP_STYLED):
             line_y = start_y + i
             if 0 <= line_y < len(result):
                 existing = result[line_y]
@@ -868,8 +991,8 @@ class EditorApp:
                 if before_visual_len < start_x:
                     before = before + " " * (start_x - before_visual_len)
                 
-                # Compose: before + styled help + reset + after
-                result[line_y] = f"{before}{style}{help_line}{reset}{after}"
+                # Compose: before + styled help + after
+                result[line_y] = f"{before}{help_line}{after}"
         
         return result
 
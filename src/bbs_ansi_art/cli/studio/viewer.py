@@ -10,12 +10,17 @@ import bbs_ansi_art as ansi
 from bbs_ansi_art.cli.core.terminal import Terminal
 from bbs_ansi_art.cli.core.input import InputReader, Key
 from bbs_ansi_art.cli.core.layout import LayoutManager, LayoutMode
-from bbs_ansi_art.cli.core.ansi_text import visible_len, truncate, pad_to_width
+from bbs_ansi_art.cli.core.ansi_text import visible_len, truncate, fit_to_width
 from bbs_ansi_art.cli.widgets.base import Rect
 from bbs_ansi_art.cli.widgets.file_list import FileListWidget, FileItem
 from bbs_ansi_art.cli.widgets.art_canvas import ArtCanvasWidget
 from bbs_ansi_art.cli.widgets.status_bar import StatusBarWidget, Shortcut
 
+# Row separator for frame output
+_ROW_SEP = b'\r\n'
+# Column separator between the file browser and the art
+_SEPARATOR = "\x1b[90m│\x1b[0m"
+
 
 class ViewerApp:
     """
@@ -69,30 +74,31 @@ class ViewerApp:
             self.file_list.load_directory(Path.cwd())
         
         with Terminal.managed_mode():
-            while self.running:
-                # Check for terminal resize
-                size = Terminal.size()
-                current_size = (size.cols, size.rows)
-                if current_size != self._last_size:
-                    self._last_size = current_size
-                    self._needs_redraw = True
-                
-                # Only redraw when needed (preserves mouse selection)
-                if self._needs_redraw:
-                    self._render()
-                    self._needs_redraw = False
-                
-                self._handle_input()
+            try:
+                while self.running:
+                    # Check for terminal resize
+                    size = Terminal.size()
+                    current_size = (size.cols, size.rows)
+                    if current_size != self._last_size:
+                        self._last_size = current_size
+                        self._needs_redraw = True
+                    
+                    # Only redraw when needed (preserves mouse selection)
+                    if self._needs_redraw:
+                        self._render()
+                        self._needs_redraw = False
+                    
+                    self._handle_input()
+            finally:
+                self.input.close()
 
     def _render(self) -> None:
         """Render the full screen without flicker."""
         size = Terminal.size()
         layout = self.layout_mgr.calculate(size.cols, size.rows)
         
-        # Move to home instead of clearing - prevents flicker
+        # Draw from home instead of clearing - prevents flicker
         # Each line ends with \x1b[K to clear any leftover content
-        Terminal.move_to(1, 1)
-        
         output_lines: list[str] = []
         
         if layout.browser_visible:
@@ -109,11 +115,9 @@ class ViewerApp:
                 art_line = art_lines[y] if y < len(art_lines) else ""
                 
                 # Ensure exact widths
-                file_line = pad_to_width(truncate(file_line, layout.browser_width), layout.browser_width)
+                file_line = fit_to_width(file_line, layout.browser_width)
                 art_line = truncate(art_line, layout.art_width)
-                
-                sep = "\x1b[90m│\x1b[0m"
-                combined = f"{file_line}{sep}{art_line}\x1b[K"
+                combined = f"{file_line}{_SEPARATOR}{art_line}\x1b[K"
                 output_lines.append(combined)
         else:
             # Art-only layout
@@ -129,10 +133,9 @@ class ViewerApp:
         for line in status_lines:
             output_lines.append(truncate(line, layout.term_width))
         
-        # Output
-        Terminal.move_to(1, 1)
-        sys.stdout.write('\r\n'.join(output_lines))
-        sys.stdout.flush()
+        # Output, encoding line by line (cheaper than encoding one joined string)
+        encoded = [line.encode('utf-8', 'replace') for line in output_lines]
+        Terminal.render_frame(_ROW_SEP.join(encoded))
 
     def _render_art_panel(self, bounds: Rect) -> list[str]:
         """Render art, SAUCE info, or error message."""
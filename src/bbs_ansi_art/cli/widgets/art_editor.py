@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Callable, Optional
 
+from bbs_ansi_art.cli.core.ansi_text import CSI_ESCAPE
 from bbs_ansi_art.cli.core.input import Key, KeyEvent
 from bbs_ansi_art.cli.widgets.base import BaseWidget, Rect
+from bbs_ansi_art.core.pixel import Pixel
 from bbs_ansi_art.edit.editable import EditableCanvas, EditContext, EditMode, ColorMode
 
 # 16-color ANSI palette for quick color selection
@@ -30,11 +32,13 @@ ANSI_16_RGB: list[tuple[int, int, int]] = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def _visible_length(s: str) -> int:
     """Calculate visible length of a string, ignoring ANSI escape sequences."""
+    if '\x1b' not in s:
+        return len(s)
     # Remove all ANSI escape sequences
-    ansi_pattern = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
-    return len(ansi_pattern.sub('', s))
+    return len(CSI_ESCAPE.sub('', s))
 
 
 def _truncate_ansi(s: str, max_width: int) -> str:
@@ -198,6 +202,12 @@ class ArtEditorWidget(BaseWidget):
         super().__init__()
         self._canvas: EditableCanvas | None = None
         self._rendered_lines: list[str] = []
+        self._render_rev: int = 0  # Bumped whenever _rendered_lines is replaced
+        
+        # Viewport lines before the cursor overlay, and the state they came
+        # from, so moving only the cursor skips re-slicing the canvas
+        self._viewport_lines: list[str] = []
+        self._viewport_key: tuple[int, int, int, int, int] | None = None
         
         # Cursor state
         self._cursor_x: int = 0
@@ -230,6 +240,7 @@ class ArtEditorWidget(BaseWidget):
         # Callbacks
         self._on_cursor_move: Callable[[int, int], None] | None = None
         self._on_modified: Callable[[], None] | None = None
+        self._on_pixel_change: Callable[[int, int, Pixel, Pixel], None] | None = None
         self._on_mode_change: Callable[[EditMode], None] | None = None
     
     @property
@@ -326,6 +337,10 @@ class ArtEditorWidget(BaseWidget):
         """Register callback for document modification."""
         self._on_modified = callback
     
+    def on_pixel_change(self, callback: Callable[[int, int, Pixel, Pixel], None] | None) -> None:
+        """Register callback for single-pixel edits. Receives (x, y, old, new)."""
+        self._on_pixel_change = callback
+    
     def on_mode_change(self, callback: Callable[[EditMode], None] | None) -> None:
         """Register callback for edit mode changes."""
         self._on_mode_change = callback
@@ -364,6 +379,7 @@ class ArtEditorWidget(BaseWidget):
         """Unload the current canvas."""
         self._canvas = None
         self._rendered_lines = []
+        self._render_rev += 1
         self._cursor_x = 0
         self._cursor_y = 0
         self._scroll_x = 0
@@ -371,6 +387,7 @@ class ArtEditorWidget(BaseWidget):
     
     def _refresh_render(self) -> None:
         """Re-render the canvas to cached lines."""
+        self._render_rev += 1
         if self._canvas is None:
             self._rendered_lines = []
             return
@@ -589,18 +606,37 @@ class ArtEditorWidget(BaseWidget):
         if self._canvas is None:
             return
         
+        old = self._pixel_at_cursor()
         self._canvas.draw_point(
             self._cursor_x,
             self._cursor_y,
             self._fg_color,
             self._context,
         )
+        self._notify_pixel_change(old)
         
         self._refresh_render()
         
         if self._on_modified:
             self._on_modified()
     
+    def _pixel_at_cursor(self) -> Pixel | None:
+        """Pixel under the cursor, if anyone is listening for pixel changes."""
+        if self._on_pixel_change is None or self._canvas is None:
+            return None
+        try:
+            return self._canvas.get_pixel(self._cursor_x, self._cursor_y)
+        except IndexError:
+            return None
+    
+    def _notify_pixel_change(self, old: Pixel | None) -> None:
+        """Report the edit at the cursor to the pixel-change callback."""
+        if old is None or self._on_pixel_change is None or self._canvas is None:
+            return
+        new = self._canvas.get_pixel(self._cursor_x, self._cursor_y)
+        if new != old:
+            self._on_pixel_change(self._cursor_x, self._cursor_y, old, new)
+    
     def _draw_and_advance(self) -> None:
         """Draw at cursor and move right."""
         self._draw_at_cursor()
@@ -611,6 +647,7 @@ class ArtEditorWidget(BaseWidget):
         if self._canvas is None:
             return
         
+        old = self._pixel_at_cursor()
         if self._context.mode == EditMode.PIXEL:
             # Pixel mode: erase to transparent
             if hasattr(self._canvas, 'erase_point'):
@@ -631,6 +668,7 @@ class ArtEditorWidget(BaseWidget):
                 self._bg_color,
                 self._context,
             )
+        self._notify_pixel_change(old)
         
         self._refresh_render()
         
@@ -831,6 +869,22 @@ class ArtEditorWidget(BaseWidget):
     # Rendering
     # -------------------------------------------------------------------------
     
+    def fingerprint(self) -> tuple[object, ...]:
+        """Return the state render() depends on, besides the bounds.
+        
+        Equal fingerprints and bounds produce the same lines, so callers
+        can reuse the previous render.
+        """
+        return (
+            self._render_rev,
+            self._cursor_x,
+            self._cursor_y,
+            self._scroll_x,
+            self._scroll_y,
+            self._fg_color,
+            self._context.mode,
+        )
+    
     def render(self, bounds: Rect) -> list[str]:
         """Render the editor with cursor overlay.
         
@@ -852,22 +906,27 @@ class ArtEditorWidget(BaseWidget):
             return lines
         
         # Get visible slice of rendered lines
-        visible_lines = []
-        for i in range(bounds.height):
-            line_idx = self._scroll_y + i
-            if line_idx < len(self._rendered_lines):
-                line = self._rendered_lines[line_idx]
-                # Apply horizontal scroll and truncate
-                if self._scroll_x > 0:
-                    line = _slice_ansi(line, self._scroll_x, self._scroll_x + bounds.width)
+        viewport_key = (
+            self._render_rev, self._scroll_x, self._scroll_y, bounds.width, bounds.height
+        )
+        if viewport_key != self._viewport_key:
+            self._viewport_lines = []
+            for i in range(bounds.height):
+                line_idx = self._scroll_y + i
+                if line_idx < len(self._rendered_lines):
+                    line = self._rendered_lines[line_idx]
+                    # Apply horizontal scroll and truncate
+                    if self._scroll_x > 0:
+                        line = _slice_ansi(line, self._scroll_x, self._scroll_x + bounds.width)
+                    else:
+                        line = _truncate_ansi(line, bounds.width)
+                    self._viewport_lines.append(line)
                 else:
-                    line = _truncate_ansi(line, bounds.width)
-                visible_lines.append(line)
-            else:
-                visible_lines.append("")
+                    self._viewport_lines.append("")
+            self._viewport_key = viewport_key
         
-        # Overlay cursor
-        visible_lines = self._overlay_cursor(visible_lines, bounds)
+        # Overlay cursor on a copy, keeping the viewport lines reusable
+        visible_lines = self._overlay_cursor(list(self._viewport_lines), bounds)
         
         # Note: Help overlay is now handled at the studio level (EditorApp)
         # to ensure proper full-screen centering over editor + palette
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
@@ -31,6 +32,20 @@ class FileItem:
             size=size,
         )
 
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry[str]) -> FileItem:
+        """Build from a scandir entry, reusing its cached type and stat."""
+        try:
+            size = entry.stat().st_size if entry.is_file() else 0
+        except OSError:
+            size = 0
+        return cls(
+            path=Path(entry.path),
+            name=entry.name,
+            is_dir=entry.is_dir(),
+            size=size,
+        )
+
 
 class FileListWidget(BaseWidget):
     """
@@ -112,12 +127,11 @@ class FileListWidget(BaseWidget):
         if self._current_dir.parent != self._current_dir:
             self._items.append(FileItem(self._current_dir.parent, "..", is_dir=True))
 
-        # Collect and sort entries
+        # Collect and sort entries. scandir caches each entry's type, so
+        # the directory is read once and is_dir() costs no extra stat.
         try:
-            entries = sorted(
-                self._current_dir.iterdir(),
-                key=lambda p: (not p.is_dir(), p.name.lower())
-            )
+            with os.scandir(self._current_dir) as it:
+                entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
         except PermissionError:
             entries = []
 
@@ -127,10 +141,10 @@ class FileListWidget(BaseWidget):
                 continue
             
             if entry.is_dir():
-                self._items.append(FileItem.from_path(entry))
+                self._items.append(FileItem.from_entry(entry))
                 self._dir_count += 1
-            elif entry.suffix.lower() in self.extensions:
-                self._items.append(FileItem.from_path(entry))
+            elif os.path.splitext(entry.name)[1].lower() in self.extensions:
+                self._items.append(FileItem.from_entry(entry))
                 self._file_count += 1
 
         self._selected = 0
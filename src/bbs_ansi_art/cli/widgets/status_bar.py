@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 
+from bbs_ansi_art.cli.core.ansi_text import SGR_ESCAPE
 from bbs_ansi_art.cli.widgets.base import BaseWidget, Rect
 from bbs_ansi_art.cli.core.input import KeyEvent
 
 
 def _visible_len(s: str) -> int:
     """Get visible length of string (excluding ANSI codes)."""
-    return len(re.sub(r'\x1b\[[0-9;]*m', '', s))
+    if '\x1b' not in s:
+        return len(s)
+    return len(SGR_ESCAPE.sub('', s))
 
 
 @dataclass
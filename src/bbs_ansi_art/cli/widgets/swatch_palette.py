@@ -14,7 +14,6 @@ from __future__ import annotations
 import colorsys
 import json
 import os
-import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -157,6 +156,9 @@ class SwatchPaletteWidget(BaseWidget):
         self._saved_swatches: list[ColorSwatch] = []
         self._swatches_file: Optional[Path] = None
         
+        # Bumped whenever the document or saved swatch lists change
+        self._swatches_rev = 0
+        
         # Standard palette
         self._standard_palette = [ColorSwatch(rgb, name) for rgb, name in zip(ANSI_16_PALETTE, ANSI_16_NAMES)]
         
@@ -252,12 +254,10 @@ class SwatchPaletteWidget(BaseWidget):
     def set_document_colors(self, colors: list[tuple[int, int, int]]) -> None:
         """Set document colors (extracted from artwork)."""
         # Deduplicate and convert to swatches
-        seen = set()
-        self._document_colors = []
-        for rgb in colors:
-            if rgb not in seen:
-                seen.add(rgb)
-                self._document_colors.append(ColorSwatch(rgb))
+        unique = list(dict.fromkeys(colors))
+        if unique != [swatch.rgb for swatch in self._document_colors]:
+            self._document_colors = [ColorSwatch(rgb) for rgb in unique]
+            self._swatches_rev += 1
         # Reset scroll/selection if needed
         if self._section_index >= len(self._document_colors):
             self._section_index = max(0, len(self._document_colors) - 1)
@@ -291,6 +291,7 @@ class SwatchPaletteWidget(BaseWidget):
             with open(self._swatches_file, 'r') as f:
                 data = json.load(f)
             self._saved_swatches = []
+            self._swatches_rev += 1
             for item in data.get('swatches', []):
                 rgb = tuple(item['rgb'])
                 name = item.get('name', '')
@@ -324,12 +325,14 @@ class SwatchPaletteWidget(BaseWidget):
             if swatch.rgb == color:
                 return
         self._saved_swatches.append(ColorSwatch(color, name))
+        self._swatches_rev += 1
         self._save_swatches()
     
     def remove_from_saved(self, index: int) -> None:
         """Remove a color from saved swatches."""
         if 0 <= index < len(self._saved_swatches):
             del self._saved_swatches[index]
+            self._swatches_rev += 1
             self._save_swatches()
     
     # -------------------------------------------------------------------------
@@ -651,6 +654,24 @@ class SwatchPaletteWidget(BaseWidget):
     # Rendering
     # -------------------------------------------------------------------------
     
+    def fingerprint(self) -> tuple[object, ...]:
+        """Return the state render() depends on, besides the bounds."""
+        return (
+            self._visible,
+            self._focused,
+            self._current_color,
+            self._active_section,
+            self._section_index,
+            tuple(self._section_collapsed.values()),
+            self._swatches_rev,
+            self._editor_open,
+            self._editor_mode,
+            self._editor_channel,
+            self._editor_color,
+            self._editor_original_color,
+            self._editor_hex_input,
+        )
+    
     def render(self, bounds: Rect) -> list[str]:
         """Render the palette widget."""
         if not self._visible:
@@ -8,7 +8,10 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
 from typing import Iterator
 
 from bbs_ansi_art.core.pixel import Pixel
@@ -23,7 +26,10 @@ ESC = "\x1b"
 CSI = f"{ESC}["
 
 # Regex for parsing ANSI SGR sequences
-SGR_PATTERN = re.compile(r'\x1b\[([0-9;]*)m')
+SGR_PATTERN = re.compile(r'\x1b\[([0-9;]*)m', re.ASCII)
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]', re.ASCII)
+
+_PIXEL_FIELDS = attrgetter('transparent', 'r', 'g', 'b')
 
 
 @dataclass
@@ -234,6 +240,16 @@ class PixelEditableCanvas(EditableCanvas):
             for x, pixel in enumerate(row):
                 yield x, y, pixel
     
+    def color_counts(self) -> Counter[tuple[int, int, int]]:
+        """Count opaque pixels by (r, g, b), in order of first appearance."""
+        # Tally whole pixels in C first, then drop the transparent ones
+        tally = Counter(map(_PIXEL_FIELDS, chain.from_iterable(self._pixels)))
+        counts: Counter[tuple[int, int, int]] = Counter()
+        for (transparent, r, g, b), n in tally.items():
+            if not transparent:
+                counts[r, g, b] += n
+        return counts
+    
     @classmethod
     def from_raw_text(cls, raw_text: str) -> PixelEditableCanvas:
         """
@@ -653,7 +669,7 @@ class PixelEditableCanvas(EditableCanvas):
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI escape sequences from text."""
-    return re.sub(r'\x1b\[[0-9;]*[a-zA-Z]', '', text)
+    return ANSI_PATTERN.sub('', text)
 
 
 def _clamp(value: int, min_val: int, max_val: int) -> int:
@@ -1,5 +1,6 @@
 """Load ANSI art files."""
 
+import re
 from pathlib import Path
 from typing import Union
 
@@ -12,6 +13,8 @@ from bbs_ansi_art.sauce.reader import parse_sauce
 ANS_EXTENSIONS = {".ans", ".asc", ".diz", ".nfo", ".ice"}
 ART_EXTENSIONS = {".art"}
 
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]', re.ASCII)
+
 
 def load(path: Union[str, Path]) -> AnsiDocument:
     """
@@ -117,8 +120,7 @@ def load_art(path: Union[str, Path]) -> AnsiDocument:
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI escape sequences from text."""
-    import re
-    return re.sub(r'\x1b\[[0-9;]*[a-zA-Z]', '', text)
+    return _ANSI_ESCAPE.sub('', text)
 
 
 def _parse_art_line(line: str, y: int, canvas: "Canvas") -> None:
@@ -503,6 +503,8 @@ def clean_file(
         strip_text_data=strip_text_data,
     )
     
-    output_path.write_bytes(cleaned)
+    # Cleaning in place leaves already-clean files untouched on disk
+    if cleaned != data or output_path != input_path:
+        output_path.write_bytes(cleaned)
     
     return output_path, result
@@ -0,0 +1,68 @@
+"""Tests for ANSI-aware string measuring and truncation."""
+
+from bbs_ansi_art.cli.core.ansi_text import (
+    fit_to_width,
+    pad_to_width,
+    truncate,
+    truncate_and_pad,
+    visible_len,
+)
+
+
+class TestVisibleLen:
+    """Tests for visible_len."""
+
+    def test_plain_text(self) -> None:
+        assert visible_len("hello") == 5
+        assert visible_len("") == 0
+
+    def test_ignores_escape_sequences(self) -> None:
+        assert visible_len("\x1b[1;31mred\x1b[0m") == 3
+        assert visible_len("\x1b[38;2;255;0;0m█\x1b[15~x") == 2
+
+
+class TestTruncate:
+    """Tests for truncate."""
+
+    def test_short_string_unchanged(self) -> None:
+        assert truncate("abc", 5) == "abc"
+        assert truncate("\x1b[31mabc\x1b[0m", 3) == "\x1b[31mabc\x1b[0m"
+
+    def test_truncates_plain_text(self) -> None:
+        assert truncate("abcdef", 3) == "abc\x1b[0m"
+        assert truncate("abcdef", 3, reset=False) == "abc"
+
+    def test_keeps_escapes_before_cut(self) -> None:
+        s = "\x1b[31mab\x1b[32mcd\x1b[0m"
+        assert truncate(s, 3) == "\x1b[31mab\x1b[32mc\x1b[0m"
+
+    def test_zero_width(self) -> None:
+        assert truncate("abc", 0) == ""
+
+
+class TestPadding:
+    """Tests for pad_to_width, truncate_and_pad and fit_to_width."""
+
+    def test_pad_to_width(self) -> None:
+        assert pad_to_width("ab", 4) == "ab\x1b[0m  "
+        assert pad_to_width("abcd", 2) == "abcd"
+
+    def test_truncate_and_pad(self) -> None:
+        assert truncate_and_pad("ab", 4) == "ab\x1b[0m  "
+        assert truncate_and_pad("abcdef", 4) == "abcd\x1b[0m"
+        assert truncate_and_pad("\x1b[31mabcd", 4) == "\x1b[31mabcd"
+
+    def test_fit_to_width(self) -> None:
+        assert fit_to_width("ab", 4) == "ab\x1b[0m  "
+        assert fit_to_width("abcdef", 4) == "abcd\x1b[0m"
+        assert fit_to_width("\x1b[31mab", 3) == "\x1b[31mab\x1b[0m "
+        assert fit_to_width("abc", 0) == ""
+
+    def test_fit_to_width_resets_after_dropped_escapes(self) -> None:
+        # Trailing escapes are cut like truncate() does, not kept
+        assert fit_to_width("\x1b[31mabcd\x1b[42m", 4) == "\x1b[31mabcd\x1b[0m"
+
+    def test_fit_to_width_matches_truncate_then_pad(self) -> None:
+        for s in ("", "abc", "\x1b[31mab\x1b[32mcd\x1b[0m", "a\x1b[15~bcdef\x1b[0m"):
+            for width in range(7):
+                assert fit_to_width(s, width) == pad_to_width(truncate(s, width), width)
@@ -0,0 +1,84 @@
+"""Tests for the art editor widget."""
+
+from bbs_ansi_art.cli.widgets.art_editor import ArtEditorWidget
+from bbs_ansi_art.cli.widgets.base import Rect
+from bbs_ansi_art.core.pixel import Pixel
+from bbs_ansi_art.edit.document import EditableDocument
+
+
+class TestPixelChange:
+    """Tests for ArtEditorWidget.on_pixel_change."""
+
+    def test_reports_old_and_new_pixel(self) -> None:
+        editor = ArtEditorWidget()
+        editor.load(EditableDocument.new_art(4, 4).canvas)
+        changes: list[tuple[int, int, Pixel, Pixel]] = []
+        editor.on_pixel_change(lambda x, y, old, new: changes.append((x, y, old, new)))
+        editor._fg_color = (170, 0, 0)
+        editor._draw_at_cursor()
+        editor._erase_at_cursor()
+        assert changes == [
+            (0, 0, Pixel(0, 0, 0), Pixel(170, 0, 0)),
+            (0, 0, Pixel(170, 0, 0), Pixel.transparent_pixel()),
+        ]
+
+    def test_no_report_when_unchanged(self) -> None:
+        editor = ArtEditorWidget()
+        editor.load(EditableDocument.new_art(4, 4).canvas)
+        changes: list[tuple[int, int, Pixel, Pixel]] = []
+        editor.on_pixel_change(lambda x, y, old, new: changes.append((x, y, old, new)))
+        editor._fg_color = (0, 0, 0)
+        editor._draw_at_cursor()
+        assert changes == []
+
+
+class TestFingerprint:
+    """Tests for ArtEditorWidget.fingerprint."""
+
+    def test_stable_without_changes(self) -> None:
+        editor = ArtEditorWidget()
+        editor.load(EditableDocument.new_art(4, 4).canvas)
+        assert editor.fingerprint() == editor.fingerprint()
+
+    def test_changes_on_cursor_move(self) -> None:
+        editor = ArtEditorWidget()
+        editor.load(EditableDocument.new_art(4, 4).canvas)
+        before = editor.fingerprint()
+        editor.move_cursor(1, 0)
+        assert editor.fingerprint() != before
+
+    def test_changes_on_draw(self) -> None:
+        editor = ArtEditorWidget()
+        editor.load(EditableDocument.new_art(4, 4).canvas)
+        editor._fg_color = (170, 0, 0)
+        before = editor.fingerprint()
+        editor._draw_at_cursor()
+        assert editor.fingerprint() != before
+
+
+class TestRender:
+    """Tests for ArtEditorWidget.render."""
+
+    def test_cursor_move_matches_fresh_render(self) -> None:
+        canvas = EditableDocument.new_art(6, 6).canvas
+        editor = ArtEditorWidget()
+        editor.load(canvas)
+        editor._fg_color = (170, 0, 0)
+        editor._draw_at_cursor()
+        editor.render(Rect(0, 0, 6, 3))
+        editor.move_cursor(2, 3)
+        fresh = ArtEditorWidget()
+        fresh.load(canvas)
+        fresh._fg_color = (170, 0, 0)
+        fresh.move_cursor(2, 3)
+        assert editor.render(Rect(0, 0, 6, 3)) == fresh.render(Rect(0, 0, 6, 3))
+
+    def test_draw_refreshes_viewport(self) -> None:
+        editor = ArtEditorWidget()
+        editor.load(EditableDocument.new_art(4, 4).canvas)
+        before = editor.render(Rect(0, 0, 4, 2))
+        editor._fg_color = (170, 0, 0)
+        editor._draw_at_cursor()
+        editor.move_cursor(1, 0)
+        after = editor.render(Rect(0, 0, 4, 2))
+        assert after[0] != before[0]
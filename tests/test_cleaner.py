@@ -116,6 +116,32 @@ class TestCleanBytes:
         assert not cleaned.endswith(b'\n')
 
 
+class TestCleanFile:
+    """Test clean_file function."""
+    
+    def test_writes_cleaned_output(self, tmp_path):
+        """Cleaned bytes are written to the output path."""
+        src = tmp_path / "art.ans"
+        src.write_bytes(b'\x1b[?7h\x1b[31mHello\x1b[0m')
+        
+        out_path, result = clean_file(src)
+        
+        assert out_path == tmp_path / "art_clean.ans"
+        assert out_path.read_bytes() == b'\x1b[31mHello\x1b[0m'
+        assert result.was_modified
+    
+    def test_in_place_skips_unchanged_file(self, tmp_path):
+        """Already-clean files are not rewritten when cleaning in place."""
+        src = tmp_path / "art.ans"
+        src.write_bytes(b'\x1b[31mHello\x1b[0m')
+        before = src.stat().st_mtime_ns
+        
+        _, result = clean_file(src, src)
+        
+        assert not result.was_modified
+        assert src.stat().st_mtime_ns == before
+
+
 class TestVisualEquivalence:
     """Test that cleaning preserves visual output."""
     
@@ -0,0 +1,34 @@
+"""Tests for keyboard input reading."""
+
+import os
+
+import pytest
+
+from bbs_ansi_art.cli.core.input import InputReader
+
+
+class TestWatch:
+    """Tests for InputReader.watch."""
+
+    def test_watched_fd_wakes_and_is_drained(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        key_r, key_w = os.pipe()
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        try:
+            with open(key_r, closefd=False) as stdin:
+                monkeypatch.setattr("sys.stdin", stdin)
+                reader = InputReader()
+                assert reader.watch(wake_r)
+                os.write(wake_w, b"\x1c")
+                assert reader.read(timeout=None) is None
+                with pytest.raises(BlockingIOError):
+                    os.read(wake_r, 1)
+                os.write(wake_w, b"\x1c")
+                os.write(key_w, b"x")
+                event = reader.read(timeout=None)
+                assert event is not None and event.char == "x"
+                reader.unwatch(wake_r)
+                reader.close()
+        finally:
+            for fd in (key_r, key_w, wake_r, wake_w):
+                os.close(fd)
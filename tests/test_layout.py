@@ -0,0 +1,83 @@
+"""Tests for the responsive TUI layout."""
+
+import pytest
+
+from bbs_ansi_art.cli.core.layout import (
+    ActivePanel,
+    LayoutManager,
+    LayoutMode,
+    calculate_layout,
+)
+
+
+class TestCalculateLayout:
+    """Tests for calculate_layout."""
+
+    @pytest.mark.parametrize(
+        "width,mode",
+        [
+            (40, LayoutMode.NARROW),
+            (79, LayoutMode.NARROW),
+            (80, LayoutMode.COMPACT),
+            (100, LayoutMode.COMPACT),
+            (101, LayoutMode.SPLIT),
+            (139, LayoutMode.SPLIT),
+            (140, LayoutMode.WIDE),
+            (200, LayoutMode.WIDE),
+        ],
+    )
+    def test_breakpoints(self, width: int, mode: LayoutMode) -> None:
+        assert calculate_layout(width, 25).mode == mode
+
+    def test_overlay_modes_hide_browser(self) -> None:
+        layout = calculate_layout(90, 25)
+        assert not layout.browser_visible
+        assert layout.browser_width == 0
+        assert layout.art_width == 90
+        assert layout.content_height == 24
+
+    def test_split_gives_art_ideal_width(self) -> None:
+        layout = calculate_layout(120, 30)
+        assert layout.art_width == 80
+        assert layout.browser_width == 120 - 80 - 1
+        assert layout.separator_width == 1
+        assert not layout.art_needs_hscroll
+
+    def test_split_squeezes_art_for_min_browser(self) -> None:
+        layout = calculate_layout(110, 30, art_content_width=132)
+        assert layout.browser_width == 20
+        assert layout.art_width == 110 - 20 - 1
+        assert layout.art_needs_hscroll
+
+    def test_wide_without_browser(self) -> None:
+        layout = calculate_layout(160, 40, browser_visible=False)
+        assert layout.browser_width == 0
+        assert layout.separator_width == 0
+        assert layout.art_width == 160
+
+    def test_same_inputs_share_result(self) -> None:
+        assert calculate_layout(120, 30) is calculate_layout(120, 30)
+        assert calculate_layout(120, 30) is not calculate_layout(121, 30)
+
+
+class TestLayoutManager:
+    """Tests for LayoutManager."""
+
+    def test_focus_moves_to_art_when_browser_hidden(self) -> None:
+        mgr = LayoutManager()
+        assert mgr.active_panel == ActivePanel.BROWSER
+        mgr.calculate(90, 25)
+        assert mgr.art_focused
+
+    def test_art_width_change_recalculates(self) -> None:
+        mgr = LayoutManager()
+        assert not mgr.calculate(120, 30).art_needs_hscroll
+        mgr.set_art_width(132)
+        assert mgr.calculate(120, 30).art_needs_hscroll
+
+    def test_unchanged_inputs_reuse_layout(self) -> None:
+        mgr = LayoutManager()
+        first = mgr.calculate(120, 30)
+        assert mgr.calculate(120, 30) is first
+        mgr.toggle_browser()
+        assert not mgr.calculate(120, 30).browser_visible
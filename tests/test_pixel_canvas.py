@@ -0,0 +1,23 @@
+"""Tests for the pixel-based editable canvas."""
+
+from bbs_ansi_art.core.pixel import Pixel
+from bbs_ansi_art.edit.pixel_canvas import PixelEditableCanvas
+
+
+class TestColorCounts:
+    """Tests for PixelEditableCanvas.color_counts."""
+
+    def test_counts_by_frequency(self) -> None:
+        canvas = PixelEditableCanvas(2, 2)
+        canvas.set_pixel(0, 0, Pixel(170, 0, 0))
+        canvas.set_pixel(1, 0, Pixel(170, 0, 0))
+        canvas.set_pixel(0, 1, Pixel(170, 0, 0))
+        assert canvas.color_counts() == {(170, 0, 0): 3, (0, 0, 0): 1}
+        assert canvas.color_counts().most_common(1) == [((170, 0, 0), 3)]
+
+    def test_transparent_pixels_not_counted(self) -> None:
+        canvas = PixelEditableCanvas(2, 1)
+        canvas.erase_point(0, 0)
+        assert canvas.color_counts() == {(0, 0, 0): 1}
+        canvas.erase_point(1, 0)
+        assert canvas.color_counts() == {}
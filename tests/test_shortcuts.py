@@ -0,0 +1,104 @@
+"""Tests for the keyboard shortcut registry."""
+
+from bbs_ansi_art.cli.core.input import Key, KeyEvent
+from bbs_ansi_art.cli.core.shortcuts import (
+    ShortcutContext,
+    ShortcutDef,
+    ShortcutRegistry,
+    create_default_shortcuts,
+)
+
+
+def _registry() -> ShortcutRegistry:
+    registry = ShortcutRegistry()
+    registry.register_many([
+        ShortcutDef(
+            id="save",
+            keys=("s",),
+            label="Save",
+            description="Save document",
+            context=(ShortcutContext.EDITOR,),
+            handler="save_document",
+            category="File",
+        ),
+        ShortcutDef(
+            id="up",
+            keys=(Key.UP, "k"),
+            label="",
+            description="Move up",
+            context=(ShortcutContext.EDITOR, ShortcutContext.PALETTE),
+            handler="move_up",
+            category="Navigation",
+        ),
+        ShortcutDef(
+            id="quit",
+            keys=("Q",),
+            label="Quit",
+            description="Quit",
+            handler="quit",
+            category="File",
+        ),
+    ])
+    return registry
+
+
+class TestMatch:
+    """Tests for ShortcutRegistry.match."""
+
+    def test_matches_char_and_key(self) -> None:
+        registry = _registry()
+        assert registry.match(KeyEvent(char="s"), ShortcutContext.EDITOR).id == "save"
+        assert registry.match(KeyEvent(key=Key.UP), ShortcutContext.PALETTE).id == "up"
+        assert registry.match(KeyEvent(char="k"), ShortcutContext.EDITOR).id == "up"
+
+    def test_respects_context(self) -> None:
+        registry = _registry()
+        assert registry.match(KeyEvent(char="s"), ShortcutContext.PALETTE) is None
+        assert registry.match(KeyEvent(char="s")) is None
+
+    def test_global_always_searched(self) -> None:
+        registry = _registry()
+        assert registry.match(KeyEvent(char="Q"), ShortcutContext.EDITOR).id == "quit"
+        assert registry.match(KeyEvent(char="Q")).id == "quit"
+
+    def test_disabled_shortcut_skipped(self) -> None:
+        registry = _registry()
+        registry.set_enabled("save", False)
+        assert registry.match(KeyEvent(char="s"), ShortcutContext.EDITOR) is None
+
+    def test_no_match(self) -> None:
+        registry = _registry()
+        assert registry.match(KeyEvent(char="z"), ShortcutContext.EDITOR) is None
+        assert registry.match(KeyEvent(raw="\x1b[99~"), ShortcutContext.EDITOR) is None
+
+
+class TestDefaultShortcuts:
+    """Tests for the default shortcut set."""
+
+    def test_color_quick_select(self) -> None:
+        registry = create_default_shortcuts()
+        first = registry.match(KeyEvent(char="1"), ShortcutContext.EDITOR)
+        last = registry.match(KeyEvent(char="0"), ShortcutContext.EDITOR)
+        assert first.handler == "select_color_0"
+        assert last.handler == "select_color_9"
+
+    def test_contexts_built_on_first_use(self) -> None:
+        registry = create_default_shortcuts()
+        assert registry.match(KeyEvent(char="Q")).id == "quit"
+        assert registry.get_for_context(ShortcutContext.PALETTE, include_global=False)
+        assert registry.get("eyedropper_pick") is not None
+        assert len(registry.all_shortcuts()) == 42
+
+    def test_help_text_groups_by_category(self) -> None:
+        registry = create_default_shortcuts()
+        lines = registry.generate_help_text(ShortcutContext.EDITOR)
+        headers = [
+            line.strip() for line in lines if line.startswith("  ") and not line.startswith("    ")
+        ]
+        assert headers[:4] == ["NAVIGATION", "DRAWING", "COLORS", "PALETTE"]
+        assert "    ↑/k               Move cursor up" in lines
+
+    def test_status_bar_hints(self) -> None:
+        registry = create_default_shortcuts()
+        hints = registry.get_status_bar_hints(ShortcutContext.EDITOR, max_hints=3)
+        assert hints == [(" /Enter", "Draw"), ("i", "Pick"), ("p", "Palette")]
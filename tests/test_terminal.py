@@ -0,0 +1,217 @@
+"""Tests for terminal output primitives."""
+
+import os
+
+import pytest
+
+from bbs_ansi_art.cli.core import terminal
+from bbs_ansi_art.cli.core.terminal import Terminal, TerminalSize
+
+
+class TestWrite:
+    """Tests for Terminal.write and Terminal.write_bytes."""
+
+    def test_write_bytes_passes_through(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        Terminal.write_bytes(b"\x1b[0m\xe2\x96\x88")
+        Terminal.flush()
+        assert capsysbinary.readouterr().out == b"\x1b[0m\xe2\x96\x88"
+
+    def test_write_encodes_utf8(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        Terminal.write("█")
+        Terminal.flush()
+        assert capsysbinary.readouterr().out == "█".encode()
+
+
+class TestMoveTo:
+    """Tests for skipping redundant cursor moves."""
+
+    @pytest.fixture(autouse=True)
+    def _screen(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(terminal, "_cur_rc", None)
+        monkeypatch.setattr(terminal, "_screen_cols", 80)
+
+    def test_repeated_move_skipped(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        Terminal.move_to(3, 4)
+        Terminal.move_to(3, 4)
+        Terminal.flush()
+        assert capsysbinary.readouterr().out == b"\x1b[3;4H"
+
+    def test_ascii_write_advances_cursor(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        Terminal.move_to(2, 1)
+        Terminal.write("abc")
+        Terminal.move_to(2, 4)
+        Terminal.flush()
+        assert capsysbinary.readouterr().out == b"\x1b[2;1Habc"
+
+    def test_escape_write_forgets_cursor(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        Terminal.move_to(2, 1)
+        Terminal.write("\x1b[1mab")
+        Terminal.move_to(2, 3)
+        Terminal.flush()
+        assert capsysbinary.readouterr().out == b"\x1b[2;1H\x1b[1mab\x1b[2;3H"
+
+    def test_clear_homes_cursor(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        Terminal.clear()
+        Terminal.move_to(1, 1)
+        Terminal.flush()
+        assert capsysbinary.readouterr().out == b"\x1b[2J\x1b[H"
+
+
+class TestRenderFrame:
+    """Tests for Terminal.render_frame."""
+
+    def test_frame_from_home(
+        self, capsysbinary: pytest.CaptureFixture[bytes], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(terminal, "_cur_rc", None)
+        Terminal.render_frame(b"ab\r\ncd")
+        assert capsysbinary.readouterr().out == b"\x1b[1;1Hab\r\ncd\x1b[0m"
+
+    def test_hide_wraps_cursor(
+        self, capsysbinary: pytest.CaptureFixture[bytes], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(terminal, "_cur_rc", None)
+        Terminal.render_frame(b"x", hide=True)
+        assert capsysbinary.readouterr().out == b"\x1b[?25l\x1b[1;1Hx\x1b[?25h\x1b[0m"
+
+
+class TestGatherWrite:
+    """Tests for large blocks written with writev."""
+
+    def test_order_preserved(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            monkeypatch.setattr(terminal, "_fd", write_fd)
+            monkeypatch.setattr(terminal, "_pending", bytearray())
+            frame = b"x" * terminal._GATHER_MIN
+            Terminal.move_to(1, 1)
+            Terminal.write_bytes(frame)
+            Terminal.reset()
+            Terminal.flush()
+            expected = b"\x1b[1;1H" + frame + b"\x1b[0m"
+            assert os.read(read_fd, len(expected) + 1) == expected
+            assert terminal._chunks == []
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_writev_batches_and_short_writes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[int] = []
+        out = bytearray()
+
+        def fake_writev(fd: int, buffers: list[memoryview]) -> int:
+            calls.append(len(buffers))
+            # Accept at most 5 bytes per call
+            data = b"".join(bytes(b) for b in buffers)[:5]
+            out.extend(data)
+            return len(data)
+
+        monkeypatch.setattr(terminal.os, "writev", fake_writev)
+        monkeypatch.setattr(terminal, "_IOV_MAX", 2)
+        terminal._raw_writev(0, [b"abc", b"", b"defg", b"hi"])
+        assert bytes(out) == b"abcdefghi"
+        assert max(calls) <= 2
+
+
+class TestPipeBuffering:
+    """Tests for flush batching when output is not a TTY."""
+
+    def test_flush_deferred_until_forced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            monkeypatch.setattr(terminal, "_fd", write_fd)
+            monkeypatch.setattr(terminal, "_buffered", True)
+            monkeypatch.setattr(terminal, "_pending", bytearray())
+            Terminal.write("frame")
+            Terminal.flush()
+            os.set_blocking(read_fd, False)
+            with pytest.raises(BlockingIOError):
+                os.read(read_fd, 100)
+            terminal._flush(force=True)
+            assert os.read(read_fd, 100) == b"frame"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_flush_once_buffer_fills(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            monkeypatch.setattr(terminal, "_fd", write_fd)
+            monkeypatch.setattr(terminal, "_buffered", True)
+            monkeypatch.setattr(terminal, "_PIPE_BUFFER", 8)
+            monkeypatch.setattr(terminal, "_pending", bytearray())
+            Terminal.write("0123456789")
+            Terminal.flush()
+            assert os.read(read_fd, 100) == b"0123456789"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+class TestSize:
+    """Tests for Terminal.size caching."""
+
+    def test_cached_until_resize(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[int] = []
+
+        def fake_size() -> os.terminal_size:
+            calls.append(1)
+            return os.terminal_size((100 + len(calls), 30))
+
+        monkeypatch.setattr(terminal.os, "get_terminal_size", fake_size)
+        monkeypatch.setattr(terminal, "_cached_size", None)
+        monkeypatch.setattr(terminal, "_watching_resize", True)
+        assert Terminal.size() == TerminalSize(30, 101)
+        assert Terminal.size() == TerminalSize(30, 101)
+        assert len(calls) == 1
+        terminal._on_resize(0, None)
+        assert Terminal.size() == TerminalSize(30, 102)
+
+    def test_resize_during_measure_is_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[int] = []
+
+        def fake_size() -> os.terminal_size:
+            calls.append(1)
+            if len(calls) == 1:
+                # SIGWINCH arrives after the ioctl but before the cache store
+                terminal._on_resize(0, None)
+            return os.terminal_size((100 + len(calls), 30))
+
+        monkeypatch.setattr(terminal.os, "get_terminal_size", fake_size)
+        monkeypatch.setattr(terminal, "_cached_size", None)
+        monkeypatch.setattr(terminal, "_watching_resize", True)
+        assert Terminal.size() == TerminalSize(30, 101)
+        assert Terminal.size() == TerminalSize(30, 102)
+        assert Terminal.size() == TerminalSize(30, 102)
+        assert len(calls) == 2
+
+
+class TestRawMode:
+    """Tests for Terminal.raw_mode."""
+
+    def test_non_tty_stdin_is_left_alone(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            with open(read_fd, closefd=False) as pipe:
+                monkeypatch.setattr(terminal.sys, "stdin", pipe)
+                with Terminal.raw_mode():
+                    pass
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+class TestMoveToBytes:
+    """Tests for Terminal.move_to_bytes."""
+
+    def test_matches_formatted_sequences(self) -> None:
+        for row, col in ((1, 1), (5, 12), (600, 1000)):
+            assert Terminal.move_to_bytes(row, col) == f"\x1b[{row};{col}H".encode()
+
+    def test_screen_width_follows_resize(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(terminal.os, "get_terminal_size", lambda: os.terminal_size((20, 10)))
+        monkeypatch.setattr(terminal, "_cached_size", None)
+        monkeypatch.setattr(terminal, "_watching_resize", True)
+        monkeypatch.setattr(terminal, "_screen_cols", 5)
+        Terminal.size()
+        assert terminal._screen_cols == 20